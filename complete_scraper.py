@@ -10,8 +10,10 @@ This gives you the most complete dataset possible.
 
 Usage:
     python complete_scraper.py 1380908
+    python complete_scraper.py 1380908 1021474 1021479 [--concurrency 5]
 """
 
+import argparse
 import asyncio
 import json
 import os
@@ -19,20 +21,200 @@ import re
 import sys
 import time
 from datetime import datetime
-from typing import Any, Dict, Optional
-
-import requests
+from typing import Any, Awaitable, Dict, List, Optional, Set
 
 try:
-    from playwright.async_api import async_playwright
+    import orjson
 except ImportError:
-    print("❌ Install playwright: pip install playwright")
-    print("   Then: playwright install chromium")
-    sys.exit(1)
+    orjson = None
+
+import requests
+from bs4 import BeautifulSoup
+
+from shared.api_client import CACHE_ENV_VAR, DEFAULT_FIELDS, NHLEAPIClient, convert_timestamp
+from shared.scraper import HTML_PARSER
+
+
+# Page resources the scraper never reads; the browser is told not to download them
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+
+# Analytics and tracking hosts whose scripts only add network and JS work to each page load
+BLOCKED_HOSTS = ('google-analytics.com', 'googletagmanager.com', 'doubleclick.net', 'hotjar.com', 'facebook.net',
+                 'clarity.ms')
+
+# List entries looked up per API query by get_api_data_batch; the FeatureServer returns up to 1000
+# features a query, but each entry adds to the GET URL, so batches stay well under URL length limits
+API_BATCH_SIZE = 200
+
+# "This list entry was subject to a Minor Amendment on [DATE]", compiled once for every description
+MINOR_AMENDMENT_RE = re.compile(
+    r'This list entry was subject to a Minor Amendment.*?on\s+(\d{1,2}[/-]\d{1,2}[/-]\d{4}|\d{1,2}\s+\w+\s+\d{4})',
+    re.IGNORECASE
+)
+
+# Collects the raw list entry texts in a single page.evaluate call; _build_web_data turns them into web_data.
+# Headings and terms are matched like Playwright's :has-text (case-insensitive substring), as parse_web_data does.
+WEB_DATA_SCRIPT = """
+() => {
+    const text = (el) => (el ? el.textContent : null);
+    const find = (selector, needle) =>
+        [...document.querySelectorAll(selector)].find((el) => el.textContent.toLowerCase().includes(needle));
+    const following = (el, tagName) => {
+        for (let sibling = el && el.nextElementSibling; sibling; sibling = sibling.nextElementSibling) {
+            if (sibling.tagName === tagName) return sibling;
+        }
+        return null;
+    };
+    const paragraphAfter = (needle) => {
+        const heading = find('h3', needle);
+        return heading ? text(following(heading, 'P')) : null;
+    };
+    const pairs = (selector) => {
+        const dl = document.querySelector(selector);
+        if (!dl) return [];
+        return [...dl.querySelectorAll('dt')]
+            .map((dt) => [dt, following(dt, 'DD')])
+            .filter(([, dd]) => dd)
+            .map(([dt, dd]) => [text(dt), text(dd)]);
+    };
+    const statutoryDt = find('dt', 'statutory address');
+    const mapLink = find('a', 'download a full scale map');
+    return {
+        title: text(document.querySelector('h1')),
+        address: text(document.querySelector('main p')),
+        key_info: pairs('dl.key-info'),
+        statutory_address: statutoryDt ? text(following(statutoryDt, 'DD')) : null,
+        location: pairs('dl.nhle__location-info'),
+        description: paragraphAfter('details'),
+        legacy: pairs('dl.nhle-legacy'),
+        sources: paragraphAfter('sources'),
+        legal: paragraphAfter('legal'),
+        map_pdf_url: mapLink ? mapLink.getAttribute('href') : null
+    };
+}
+"""
 
 
-# NHLE API Configuration
-NHLE_API_BASE = "https://services-eu1.arcgis.com/ZOdPfBS3aqqDYPUQ/arcgis/rest/services/National_Heritage_List_for_England_NHLE_v02_VIEW/FeatureServer/0/query"
+def _load_playwright():
+    """Import Playwright on first use, so --help and API-only imports don't pay for it"""
+    try:
+        from playwright.async_api import async_playwright
+    except ImportError:
+        print("❌ Install playwright: pip install playwright")
+        print("   Then: playwright install chromium")
+        sys.exit(1)
+    return async_playwright
+
+
+class PlaywrightSession:
+    """
+    One Chromium browser shared by every web scrape in a run.
+
+    Launching Chromium costs a second or two, so it is done once, on the first scrape
+    that needs a browser; each scrape then gets its own lightweight browser context
+    for isolation. Runs served entirely by the static fast path never launch it.
+
+    Once a scrape has accepted the cookie banner, its cookies are kept in storage_state
+    and seeded into later contexts, so the banner is only dealt with once per session.
+    """
+
+    def __init__(self, headless: bool = True):
+        self.headless = headless
+        self.playwright = None
+        self.browser = None
+        self.storage_state = None
+        self._launch_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> 'PlaywrightSession':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if self.browser is not None:
+            await self.browser.close()
+            await self.playwright.stop()
+
+    async def get_browser(self):
+        """Return the shared browser, launching it on first use"""
+        async with self._launch_lock:
+            if self.browser is None:
+                async_playwright = _load_playwright()
+                self.playwright = await async_playwright().start()
+                self.browser = await self.playwright.chromium.launch(headless=self.headless)
+        return self.browser
+
+
+async def _block_unused_requests(route):
+    """Abort requests for resources no selector reads; let everything else through"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(host in request.url for host in BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def _minor_amendment_date(description: str) -> Optional[str]:
+    """Extract the minor amendment date from a list entry description, if it mentions one"""
+    minor_amendment_match = MINOR_AMENDMENT_RE.search(description)
+    return minor_amendment_match.group(1) if minor_amendment_match else None
+
+
+def save_json(path: str, data: Any):
+    """Write data as indented UTF-8 JSON, encoding with orjson when it is installed"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _point_coordinates(geometry: Optional[Dict[str, Any]]) -> tuple[Optional[float], Optional[float]]:
+    """(longitude, latitude) of a GeoJSON Point, or the first point of a MultiPoint; (None, None) otherwise"""
+    if not geometry:
+        return None, None
+    coordinates = geometry.get('coordinates')
+    if geometry.get('type') == 'MultiPoint' and coordinates:
+        coordinates = coordinates[0]
+    elif geometry.get('type') != 'Point':
+        return None, None
+    return coordinates[0], coordinates[1]
+
+
+def _api_query(where: str) -> Dict[str, Any]:
+    """Query parameters for the building fields read by _build_api_data"""
+    # Only the fields read below, as GeoJSON with WGS84 coordinates so the geometry is already lon/lat
+    return {
+        'where': where,
+        'outFields': ','.join(DEFAULT_FIELDS),
+        'returnGeometry': 'true',
+        'outSR': '4326',
+        'f': 'geojson'
+    }
+
+
+def _build_api_data(feature: Dict[str, Any]) -> Dict[str, Any]:
+    """Build api_data from one GeoJSON feature"""
+    attrs = feature.get('properties') or {}
+    longitude, latitude = _point_coordinates(feature.get('geometry'))
+
+    return {
+        'name': attrs.get('Name'),
+        'grade': attrs.get('Grade'),
+        'list_entry': attrs.get('ListEntry'),
+        'list_date': convert_timestamp(attrs.get('ListDate')),
+        'amend_date': convert_timestamp(attrs.get('AmendDate')),
+        'category': attrs.get('Category'),
+        'location': {
+            'ngr': attrs.get('NGR'),
+            'easting': attrs.get('Easting'),
+            'northing': attrs.get('Northing'),
+            'capturescale': attrs.get('CaptureScale'),
+            'longitude': longitude,
+            'latitude': latitude
+        },
+        'hyperlink': attrs.get('hyperlink')
+    }
 
 
 def get_api_data(list_entry_number: str) -> tuple[Optional[Dict[str, Any]], float]:
@@ -44,54 +226,15 @@ def get_api_data(list_entry_number: str) -> tuple[Optional[Dict[str, Any]], floa
     print(f"🔍 Fetching API data for {list_entry_number}...")
     start_time = time.time()
 
-    def convert_timestamp(timestamp_ms: Optional[int]) -> Optional[str]:
-        """Convert Unix timestamp in milliseconds to readable date format (DD-MMM-YYYY)"""
-        if timestamp_ms is None:
-            return None
-        try:
-            dt = datetime.fromtimestamp(timestamp_ms / 1000)
-            return dt.strftime('%d-%b-%Y')
-        except:
-            return None
-
     try:
-        params = {
-            'where': f"ListEntry = '{list_entry_number}'",
-            'outFields': '*',
-            'returnGeometry': 'true',
-            'f': 'json'
-        }
+        features = NHLEAPIClient.get_default().query_features(_api_query(f"ListEntry = '{list_entry_number}'"), limit=1)
 
-        response = requests.get(NHLE_API_BASE, params=params, timeout=30)
-        response.raise_for_status()
-        data = response.json()
-
-        if 'features' not in data or not data['features']:
+        if not features:
             elapsed = time.time() - start_time
             print(f"   ⚠️  No API data found ({elapsed:.2f}s)")
             return None, elapsed
 
-        feature = data['features'][0]
-        attrs = feature.get('attributes', {})
-        geometry = feature.get('geometry', {})
-
-        api_data = {
-            'name': attrs.get('Name'),
-            'grade': attrs.get('Grade'),
-            'list_entry': attrs.get('ListEntry'),
-            'list_date': convert_timestamp(attrs.get('ListDate')),
-            'amend_date': convert_timestamp(attrs.get('AmendDate')),
-            'category': attrs.get('Category'),
-            'location': {
-                'ngr': attrs.get('NGR'),
-                'easting': attrs.get('Easting'),
-                'northing': attrs.get('Northing'),
-                'capturescale': attrs.get('CaptureScale'),
-                'longitude': geometry.get('x') if geometry else None,
-                'latitude': geometry.get('y') if geometry else None
-            },
-            'hyperlink': attrs.get('hyperlink')
-        }
+        api_data = _build_api_data(features[0])
 
         elapsed = time.time() - start_time
         print(f"   ✅ API: {api_data['name']} (Grade {api_data['grade']}) ({elapsed:.2f}s)")
@@ -103,153 +246,265 @@ def get_api_data(list_entry_number: str) -> tuple[Optional[Dict[str, Any]], floa
         return None, elapsed
 
 
-async def scrape_web_data(list_entry_number: str, headless: bool = True) -> tuple[Optional[Dict[str, Any]], float]:
+def _is_list_entry_number(value: str) -> bool:
+    """True for a list entry number in the canonical form the API returns: digits, no leading zeros"""
+    return value.isdigit() and str(int(value)) == value
+
+
+def get_api_data_batch(list_entry_numbers: List[str]) -> tuple[Dict[str, Dict[str, Any]], Set[str], float]:
+    """
+    Fetch data for many list entries from the NHLE API, API_BATCH_SIZE entries per query.
+
+    Returns tuple of (structured data keyed by list entry number, entries that could not be looked up,
+    elapsed time in seconds). Entries the API has no record of are in neither. Numbers not in canonical
+    form are never put in a query, and like the entries of a failed query they are left for the caller
+    to look up on their own with get_api_data
+    """
+    list_entry_numbers = list(dict.fromkeys(list_entry_numbers))
+    print(f"🔍 Fetching API data for {len(list_entry_numbers)} list entries...")
+    start_time = time.time()
+
+    api_data_by_entry = {}
+    failed = {number for number in list_entry_numbers if not _is_list_entry_number(number)}
+    queried = [number for number in list_entry_numbers if number not in failed]
+    for offset in range(0, len(queried), API_BATCH_SIZE):
+        chunk = queried[offset:offset + API_BATCH_SIZE]
+        where = "ListEntry IN ({})".format(','.join(f"'{number}'" for number in chunk))
+        try:
+            for feature in NHLEAPIClient.get_default().query_features(_api_query(where)):
+                api_data = _build_api_data(feature)
+                api_data_by_entry[str(api_data['list_entry'])] = api_data
+        except Exception as e:
+            print(f"   ❌ API error for {len(chunk)} entries: {e}")
+            failed.update(chunk)
+
+    elapsed = time.time() - start_time
+    print(f"   ✅ API: {len(api_data_by_entry)} of {len(list_entry_numbers)} entries found ({elapsed:.2f}s)")
+    return api_data_by_entry, failed, elapsed
+
+
+def _definition_texts(dl) -> List[tuple[str, str]]:
+    """Return the (term, definition) texts of a <dl>, pairing each <dt> with the <dd> that follows it"""
+    pairs = []
+    for dt in dl.find_all('dt'):
+        dd = dt.find_next_sibling('dd')
+        if dd:
+            pairs.append((dt.get_text(), dd.get_text()))
+    return pairs
+
+
+def _find_containing(soup: BeautifulSoup, tag: str, text: str):
+    """First `tag` element whose text contains `text` (case-insensitive), or None"""
+    for element in soup.find_all(tag):
+        if text in element.get_text().lower():
+            return element
+    return None
+
+
+def _paragraph_after(soup: BeautifulSoup, text: str) -> Optional[str]:
+    """Text of the first <p> following the first <h3> containing `text`, or None"""
+    heading = _find_containing(soup, 'h3', text)
+    paragraph = heading.find_next_sibling('p') if heading else None
+    return paragraph.get_text() if paragraph else None
+
+
+def _section_items(pairs: List[tuple[str, str]]) -> Dict[str, str]:
+    """Key (term, definition) pairs by their snake_cased term"""
+    return {dt.strip().rstrip(':').lower().replace(' ', '_'): dd.strip() for dt, dd in pairs}
+
+
+def _build_web_data(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Build web_data from the raw page texts collected by WEB_DATA_SCRIPT or parse_web_data"""
+    web_data = {}
+
+    # Title
+    if raw['title'] is not None:
+        web_data['title'] = raw['title'].strip()
+
+    # Address
+    addr_text = raw['address']
+    if addr_text and len(addr_text) < 200:
+        web_data['address'] = addr_text.strip()
+
+    # Key info
+    web_data['key_info'] = {dt.strip().rstrip(':'): dd.strip() for dt, dd in raw['key_info']}
+
+    # Extract major amendment date from key_info
+    major_amendment_date = web_data['key_info'].get('Date of most recent amendment')
+    web_data['major_amendment_date'] = major_amendment_date if major_amendment_date else None
+
+    # Location
+    web_data['location'] = {}
+    if raw['statutory_address'] is not None:
+        web_data['location']['statutory_address'] = raw['statutory_address'].strip()
+    web_data['location'].update(_section_items(raw['location']))
+
+    # Architectural description (THE MOST IMPORTANT PART!)
+    if raw['description'] is not None:
+        description_text = raw['description'].strip()
+        web_data['description'] = description_text
+        web_data['minor_amendment_date'] = _minor_amendment_date(description_text)
+
+    # Legacy
+    web_data['legacy'] = _section_items(raw['legacy'])
+
+    # Sources and legal
+    for key in ('sources', 'legal'):
+        if raw[key] is not None:
+            web_data[key] = raw[key].strip()
+
+    # Map PDF
+    if raw['map_pdf_url'] is not None:
+        web_data['map_pdf_url'] = raw['map_pdf_url']
+
+    return web_data
+
+
+def parse_web_data(html: str) -> Dict[str, Any]:
+    """
+    Extract the list entry fields from official list entry HTML.
+
+    Collects the same raw texts as WEB_DATA_SCRIPT does on the live page, so either source gives the same keys.
+    """
+    soup = BeautifulSoup(html, HTML_PARSER)
+
+    def text(element) -> Optional[str]:
+        return element.get_text() if element else None
+
+    def pairs(selector: str) -> List[tuple[str, str]]:
+        dl = soup.select_one(selector)
+        return _definition_texts(dl) if dl else []
+
+    statutory_dt = _find_containing(soup, 'dt', 'statutory address')
+    map_link = _find_containing(soup, 'a', 'download a full scale map')
+    return _build_web_data({
+        'title': text(soup.find('h1')),
+        'address': text(soup.select_one('main p')),
+        'key_info': pairs('dl.key-info'),
+        'statutory_address': text(statutory_dt.find_next_sibling('dd')) if statutory_dt else None,
+        'location': pairs('dl.nhle__location-info'),
+        'description': _paragraph_after(soup, 'details'),
+        'legacy': pairs('dl.nhle-legacy'),
+        'sources': _paragraph_after(soup, 'sources'),
+        'legal': _paragraph_after(soup, 'legal'),
+        'map_pdf_url': map_link.get('href') if map_link else None
+    })
+
+
+def fetch_web_data_static(list_entry_number: str) -> tuple[Optional[Dict[str, Any]], float]:
+    """
+    Fetch the server-rendered list entry page over plain HTTP and parse it, without a browser.
+
+    Returns tuple of (web data, elapsed time in seconds); the data is None if the page
+    could not be fetched or is missing the description, so the caller can fall back to Playwright.
+    """
+    print(f"📋 Fetching web page for {list_entry_number}...")
+    start_time = time.time()
+
+    url = f"https://historicengland.org.uk/listing/the-list/list-entry/{list_entry_number}?section=official-list-entry"
+    try:
+        response = NHLEAPIClient.get_default().session.get(url, timeout=30)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        elapsed = time.time() - start_time
+        print(f"   ⚠️  Static fetch failed: {e} ({elapsed:.2f}s)")
+        return None, elapsed
+
+    web_data = parse_web_data(response.text)
+    elapsed = time.time() - start_time
+    if not web_data.get('description'):
+        print(f"   ⚠️  No description in static page, falling back to browser ({elapsed:.2f}s)")
+        return None, elapsed
+
+    print(f"   ✅ Web: {web_data.get('title', 'N/A')} ({elapsed:.2f}s)")
+    return web_data, elapsed
+
+
+async def get_web_data(list_entry_number: str, headless: bool = True,
+                       session: Optional[PlaywrightSession] = None) -> tuple[Optional[Dict[str, Any]], float]:
+    """
+    Get the official list entry data, from the static page when possible and the browser otherwise.
+
+    Returns tuple of (web data, elapsed time in seconds across both attempts)
+    """
+    web_data, static_time = await asyncio.to_thread(fetch_web_data_static, list_entry_number)
+    if web_data:
+        return web_data, static_time
+
+    web_data, browser_time = await scrape_web_data(list_entry_number, headless=headless, session=session)
+    return web_data, static_time + browser_time
+
+
+async def scrape_web_data(list_entry_number: str, headless: bool = True,
+                          session: Optional[PlaywrightSession] = None) -> tuple[Optional[Dict[str, Any]], float]:
     """
     Scrape detailed data from the official list entry web page.
 
+    Pass an open PlaywrightSession to reuse its browser; without one, a browser is launched for this call.
+
     Returns tuple of (comprehensive description and detailed metadata, elapsed time in seconds)
     """
+    if session is None:
+        async with PlaywrightSession(headless=headless) as session:
+            return await scrape_web_data(list_entry_number, session=session)
+
     print(f"📋 Scraping web page for {list_entry_number}...")
     start_time = time.time()
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=headless)
-        context = await browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        )
-        page = await context.new_page()
+    browser = await session.get_browser()
+    context = await browser.new_context(
+        viewport={'width': 1920, 'height': 1080},
+        user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+        storage_state=session.storage_state
+    )
+    await context.route('**/*', _block_unused_requests)
+    page = await context.new_page()
 
-        try:
-            url = f"https://historicengland.org.uk/listing/the-list/list-entry/{list_entry_number}?section=official-list-entry"
+    try:
+        url = f"https://historicengland.org.uk/listing/the-list/list-entry/{list_entry_number}?section=official-list-entry"
 
-            await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+        # Return as soon as the response starts arriving; wait_for_selector('h1') below gates extraction
+        await page.goto(url, wait_until='commit', timeout=30000)
 
-            # Handle cookies
-            await asyncio.sleep(2)
+        await page.wait_for_selector('h1', timeout=10000)
+
+        # Handle cookies: click the banner if it shows up shortly, otherwise carry on.
+        # Extraction reads the DOM directly, so nothing needs to wait for the banner to go away.
+        # After the first accept the consent cookie is carried into every new context, so later scrapes skip this.
+        if session.storage_state is None:
             try:
-                cookie_btn = page.locator('button:has-text("Accept all")').first
-                if await cookie_btn.is_visible(timeout=3000):
-                    await cookie_btn.click()
-                    await asyncio.sleep(2)
-            except:
+                await page.locator('button:has-text("Accept all")').first.click(timeout=1500)
+                session.storage_state = await context.storage_state()
+            except Exception:
                 pass
 
-            await page.wait_for_selector('h1', timeout=10000)
-            await asyncio.sleep(1)
-
-            web_data = {}
-
-            # Title
-            title_elem = page.locator('h1').first
-            if await title_elem.count() > 0:
-                web_data['title'] = (await title_elem.text_content()).strip()
-
-            # Address
-            address_elem = page.locator('main p').first
-            if await address_elem.count() > 0:
-                addr_text = await address_elem.text_content()
-                if addr_text and len(addr_text) < 200:
-                    web_data['address'] = addr_text.strip()
-
-            # Key info
-            web_data['key_info'] = {}
-            key_info_dl = page.locator('dl.key-info').first
-            if await key_info_dl.count() > 0:
-                dts = await key_info_dl.locator('dt').all_text_contents()
-                dds = await key_info_dl.locator('dd').all_text_contents()
-                for dt, dd in zip(dts, dds):
-                    web_data['key_info'][dt.strip().rstrip(':')] = dd.strip()
-
-            # Extract major amendment date from key_info
-            major_amendment_date = web_data['key_info'].get('Date of most recent amendment')
-            web_data['major_amendment_date'] = major_amendment_date if major_amendment_date else None
-
-            # Location
-            web_data['location'] = {}
-            statutory_dt = page.locator('dt:has-text("Statutory Address")').first
-            if await statutory_dt.count() > 0:
-                dd = statutory_dt.locator('xpath=following-sibling::dd[1]')
-                if await dd.count() > 0:
-                    web_data['location']['statutory_address'] = (await dd.text_content()).strip()
-
-            location_dl = page.locator('dl.nhle__location-info').first
-            if await location_dl.count() > 0:
-                dts = await location_dl.locator('dt').all_text_contents()
-                dds = await location_dl.locator('dd').all_text_contents()
-                for dt, dd in zip(dts, dds):
-                    key = dt.strip().rstrip(':').lower().replace(' ', '_')
-                    web_data['location'][key] = dd.strip()
-
-            # Architectural description (THE MOST IMPORTANT PART!)
-            details_heading = page.locator('h3:has-text("Details")').first
-            if await details_heading.count() > 0:
-                desc_p = details_heading.locator('xpath=following-sibling::p[1]')
-                if await desc_p.count() > 0:
-                    description_text = (await desc_p.text_content()).strip()
-                    web_data['description'] = description_text
-
-                    # Extract minor amendment date from description
-                    # Pattern: "This list entry was subject to a Minor Amendment on [DATE]"
-                    minor_amendment_match = re.search(
-                        r'This list entry was subject to a Minor Amendment.*?on\s+(\d{1,2}[/-]\d{1,2}[/-]\d{4}|\d{1,2}\s+\w+\s+\d{4})',
-                        description_text,
-                        re.IGNORECASE
-                    )
-                    if minor_amendment_match:
-                        web_data['minor_amendment_date'] = minor_amendment_match.group(1)
-                    else:
-                        web_data['minor_amendment_date'] = None
-
-            # Legacy
-            web_data['legacy'] = {}
-            legacy_dl = page.locator('dl.nhle-legacy').first
-            if await legacy_dl.count() > 0:
-                dts = await legacy_dl.locator('dt').all_text_contents()
-                dds = await legacy_dl.locator('dd').all_text_contents()
-                for dt, dd in zip(dts, dds):
-                    key = dt.strip().rstrip(':').lower().replace(' ', '_')
-                    web_data['legacy'][key] = dd.strip()
-
-            # Sources
-            sources_heading = page.locator('h3:has-text("Sources")').first
-            if await sources_heading.count() > 0:
-                sources_p = sources_heading.locator('xpath=following-sibling::p[1]')
-                if await sources_p.count() > 0:
-                    web_data['sources'] = (await sources_p.text_content()).strip()
-
-            # Legal
-            legal_heading = page.locator('h3:has-text("Legal")').first
-            if await legal_heading.count() > 0:
-                legal_p = legal_heading.locator('xpath=following-sibling::p[1]')
-                if await legal_p.count() > 0:
-                    web_data['legal'] = (await legal_p.text_content()).strip()
-
-            # Map PDF
-            map_link = page.locator('a:has-text("Download a full scale map")').first
-            if await map_link.count() > 0:
-                web_data['map_pdf_url'] = await map_link.get_attribute('href')
+        # One in-page call gathers every field, rather than a CDP round-trip per locator
+        web_data = _build_web_data(await page.evaluate(WEB_DATA_SCRIPT))
 
-            elapsed = time.time() - start_time
-            print(f"   ✅ Web: {web_data.get('title', 'N/A')} ({elapsed:.2f}s)")
-            return web_data, elapsed
+        elapsed = time.time() - start_time
+        print(f"   ✅ Web: {web_data.get('title', 'N/A')} ({elapsed:.2f}s)")
+        return web_data, elapsed
 
-        except Exception as e:
-            elapsed = time.time() - start_time
-            print(f"   ❌ Web scraping error: {e} ({elapsed:.2f}s)")
-            return None, elapsed
+    except Exception as e:
+        elapsed = time.time() - start_time
+        print(f"   ❌ Web scraping error: {e} ({elapsed:.2f}s)")
+        return None, elapsed
 
-        finally:
-            await browser.close()
+    finally:
+        await context.close()
 
 
-async def scrape_complete(list_entry_number: str, headless: bool = True) -> Dict[str, Any]:
+async def scrape_complete(list_entry_number: str, headless: bool = True,
+                          session: Optional[PlaywrightSession] = None,
+                          api_lookup: Optional[Awaitable[tuple[Optional[Dict[str, Any]], float]]] = None) -> Dict[str, Any]:
     """
     Get complete data by combining API and web scraping.
 
     Args:
         list_entry_number: The NHLE list entry number
         headless: Run browser in headless mode
+        session: Open PlaywrightSession whose browser is reused if the web page needs one
+        api_lookup: Awaitable giving (api data, seconds) in place of a get_api_data call, e.g. from a batch query
 
     Returns:
         Complete dataset with both API and scraped data
@@ -273,14 +528,18 @@ async def scrape_complete(list_entry_number: str, headless: bool = True) -> Dict
         'success': False
     }
 
-    # Get API data (fast)
-    api_data, api_time = get_api_data(list_entry_number)
+    # Get API data (fast) in a worker thread while the web page (detailed) is fetched,
+    # so the total is the slower of the two rather than their sum
+    if api_lookup is None:
+        api_lookup = asyncio.to_thread(get_api_data, list_entry_number)
+    (api_data, api_time), (web_data, web_time) = await asyncio.gather(
+        api_lookup,
+        get_web_data(list_entry_number, headless=headless, session=session)
+    )
     result['timing']['api_seconds'] = round(api_time, 2)
     if api_data:
         result['api_data'] = api_data
 
-    # Get web data (detailed)
-    web_data, web_time = await scrape_web_data(list_entry_number, headless=headless)
     result['timing']['web_scraping_seconds'] = round(web_time, 2)
     if web_data:
         result['web_data'] = web_data
@@ -295,58 +554,123 @@ async def scrape_complete(list_entry_number: str, headless: bool = True) -> Dict
     return result
 
 
+async def scrape_complete_batch(list_entry_numbers: List[str], headless: bool = True, max_concurrency: int = 5,
+                                session: Optional[PlaywrightSession] = None) -> List[Dict[str, Any]]:
+    """
+    Get complete data for several list entries, running up to max_concurrency of them at once.
+
+    All entries share one browser (the given session, or one opened for the batch), and their
+    API data comes from get_api_data_batch, run alongside the web scrapes. Entries the batch could
+    not look up fall back to their own get_api_data call. The batch query time is reported as
+    timing.api_batch_seconds; timing.api_seconds only counts an entry's own fallback lookup.
+
+    Returns results in the same order as list_entry_numbers
+    """
+    if session is None:
+        async with PlaywrightSession(headless=headless) as session:
+            return await scrape_complete_batch(list_entry_numbers, max_concurrency=max_concurrency, session=session)
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    api_batch = asyncio.ensure_future(asyncio.to_thread(get_api_data_batch, list_entry_numbers))
+
+    async def api_lookup(list_entry_number: str) -> tuple[Optional[Dict[str, Any]], float]:
+        api_data_by_entry, failed, _ = await api_batch
+        if list_entry_number in failed:
+            return await asyncio.to_thread(get_api_data, list_entry_number)
+        return api_data_by_entry.get(list_entry_number), 0.0
+
+    async def scrape_one(list_entry_number: str) -> Dict[str, Any]:
+        async with semaphore:
+            result = await scrape_complete(list_entry_number, session=session, api_lookup=api_lookup(list_entry_number))
+        result['timing']['api_batch_seconds'] = round(api_batch.result()[2], 2)
+        return result
+
+    return await asyncio.gather(*(scrape_one(number) for number in list_entry_numbers))
+
+
+def print_summary(result: Dict[str, Any], output_file: str):
+    """Print the headline API and web fields of a complete result"""
+    # Built up and written in one go, so summaries from a batch don't cost a write per line
+    lines = [
+        f"\n{'='*70}",
+        f"📊 SUMMARY for {result['list_entry_number']}",
+        f"{'='*70}"
+    ]
+
+    api = result['api_data']
+    if api:
+        lines += [
+            f"\n✅ API DATA:",
+            f"   Name: {api.get('name')}",
+            f"   Grade: {api.get('grade')}",
+            f"   Listed: {api.get('list_date')}",
+            f"   Category: {api.get('category')}",
+            f"   NGR: {api['location'].get('ngr')}",
+            f"   Coordinates: {api['location'].get('latitude')}, {api['location'].get('longitude')}"
+        ]
+
+    web = result['web_data']
+    if web:
+        lines += [
+            f"\n✅ WEB DATA:",
+            f"   Title: {web.get('title')}",
+            f"   Address: {web.get('address')}",
+            f"   Key Info: {len(web.get('key_info', {}))} fields",
+            f"   Location: {len(web.get('location', {}))} fields"
+        ]
+        if web.get('description'):
+            lines.append(f"   Description: {len(web['description'])} characters")
+        lines.append(f"   Legacy ID: {web.get('legacy', {}).get('legacy_system_number')}")
+
+    lines.append(f"\n💾 Complete data saved to: {output_file}")
+
+    if not result['success']:
+        lines.append(f"\n⚠️  Warning: No data retrieved")
+
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+def _list_entry_argument(value: str) -> str:
+    """argparse type for a list entry number, normalised to the form the API returns (e.g. 01380908 -> 1380908)"""
+    if not value.isdigit():
+        raise argparse.ArgumentTypeError(f"invalid list entry number: {value!r}")
+    return str(int(value))
+
+
 async def main():
     """Example usage"""
+    parser = argparse.ArgumentParser(description="Complete Historic England Scraper (API + Web Scraping)")
+    parser.add_argument("list_entry_numbers", nargs="*", type=_list_entry_argument, default=["1380908"],
+                        metavar="list_entry_number",
+                        help="One or more NHLE list entry numbers (default: 1380908)")
+    parser.add_argument("--concurrency", "-j", type=int, default=5,
+                        help="Number of list entries to scrape at once (default: 5)")
+    parser.add_argument("--cache-name", default=os.environ.get(CACHE_ENV_VAR) or None,
+                        help=f"Cache API and page requests on disk in this SQLite file, for repeat runs "
+                             f"(default: ${CACHE_ENV_VAR}, or no cache; needs requests-cache)")
+    args = parser.parse_args()
+
+    # The shared client picks its cache up from the environment when first created. Cached entries past
+    # their expiry are revalidated with their ETag/Last-Modified, so unchanged responses cost a 304.
+    if args.cache_name:
+        os.environ[CACHE_ENV_VAR] = args.cache_name
+
     print("🏛️  Complete Historic England Scraper")
     print("   (API + Web Scraping)\n")
 
-    # Get list entry number from command line or use default
-    list_entry_number = sys.argv[1] if len(sys.argv) > 1 else '1380908'
-
     # Scrape complete data
-    result = await scrape_complete(list_entry_number, headless=True)
+    results = await scrape_complete_batch(args.list_entry_numbers, headless=True, max_concurrency=args.concurrency)
 
     # Create results directory if it doesn't exist
     os.makedirs('results', exist_ok=True)
 
-    # Save to file in results folder
-    output_file = f'results/complete_{list_entry_number}.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
-
-    # Print summary
-    print(f"\n{'='*70}")
-    print(f"📊 SUMMARY for {list_entry_number}")
-    print(f"{'='*70}")
-
-    if result['api_data']:
-        api = result['api_data']
-        print(f"\n✅ API DATA:")
-        print(f"   Name: {api.get('name')}")
-        print(f"   Grade: {api.get('grade')}")
-        print(f"   Listed: {api.get('list_date')}")
-        print(f"   Category: {api.get('category')}")
-        print(f"   NGR: {api['location'].get('ngr')}")
-        print(f"   Coordinates: {api['location'].get('latitude')}, {api['location'].get('longitude')}")
-
-    if result['web_data']:
-        web = result['web_data']
-        print(f"\n✅ WEB DATA:")
-        print(f"   Title: {web.get('title')}")
-        print(f"   Address: {web.get('address')}")
-        print(f"   Key Info: {len(web.get('key_info', {}))} fields")
-        print(f"   Location: {len(web.get('location', {}))} fields")
-        if web.get('description'):
-            print(f"   Description: {len(web['description'])} characters")
-        print(f"   Legacy ID: {web.get('legacy', {}).get('legacy_system_number')}")
-
-    print(f"\n💾 Complete data saved to: {output_file}")
-
-    if not result['success']:
-        print(f"\n⚠️  Warning: No data retrieved")
-        return 1
+    for result in results:
+        # Save to file in results folder
+        output_file = f"results/complete_{result['list_entry_number']}.json"
+        save_json(output_file, result)
+        print_summary(result, output_file)
 
-    return 0
+    return 0 if all(result['success'] for result in results) else 1
 
 
 if __name__ == "__main__":
@@ -12,24 +12,90 @@ This script:
 5. Supports resuming interrupted downloads
 
 Usage:
-    python database_scraper.py [--batch-size 1000] [--database historic_england.db] [--resume]
+    python database_scraper.py [--batch-size 1000] [--concurrency 4] [--database historic_england.db] [--resume] [--log-file database_scraper.log]
 """
 
 import argparse
 import json
+import logging
 import os
 import sqlite3
 import sys
+import threading
 import time
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-import requests
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from tqdm import tqdm
 
 # Import our existing API client
-from shared.api_client import NHLEAPIClient
+from shared.api_client import NHLEAPIClient, convert_timestamp, parse_json
+
+# Applied to every new SQLite connection: WAL lets --stats read while a scrape writes and, with
+# synchronous=NORMAL, commits no longer fsync the main file; the rest give SQLite more memory to work in
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000"
+)
+
+# Building fields in INSERT_BUILDING_SQL column order; SQLite fills in scraped_at
+BUILDING_COLUMNS = ('name', 'grade', 'list_entry', 'list_date', 'amend_date', 'category', 'ngr',
+                    'easting', 'northing', 'capture_scale', 'longitude', 'latitude', 'hyperlink')
+LIST_ENTRY_INDEX = BUILDING_COLUMNS.index('list_entry')
+
+# Upsert for one building row, in the sqlite3 driver's own qmark style. It is passed straight to the
+# driver with exec_driver_sql, so the hot insert path skips SQLAlchemy's statement compilation and
+# named-parameter binding; given a list of row tuples it becomes a single executemany.
+# ON CONFLICT updates an existing list_entry in place, where INSERT OR REPLACE would delete the old
+# row and insert a new one (new id, every index rewritten); created_at is kept, scraped_at refreshed
+INSERT_BUILDING_SQL = """
+    INSERT INTO buildings 
+    (name, grade, list_entry, list_date, amend_date, category, ngr, 
+     easting, northing, capture_scale, longitude, latitude, hyperlink)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(list_entry) DO UPDATE SET
+        name = excluded.name, grade = excluded.grade, list_date = excluded.list_date,
+        amend_date = excluded.amend_date, category = excluded.category, ngr = excluded.ngr,
+        easting = excluded.easting, northing = excluded.northing, capture_scale = excluded.capture_scale,
+        longitude = excluded.longitude, latitude = excluded.latitude, hyperlink = excluded.hyperlink,
+        scraped_at = CURRENT_TIMESTAMP
+"""
+
+# Per-row failures go to the log file rather than stdout, which tqdm is drawing on
+logger = logging.getLogger(__name__)
+
+# Attributes fetch_batch stores, requested by name instead of outFields=* to keep batch responses small.
+# The layer has no usable Category (null in every stored record), so it is not requested and stored as None.
+BATCH_ATTRIBUTES = ('Name', 'Grade', 'ListEntry', 'ListDate', 'AmendDate', 'NGR',
+                    'Easting', 'Northing', 'CaptureScale', 'hyperlink')
+BATCH_FIELDS = ','.join(BATCH_ATTRIBUTES)
+
+# Pause taken when the API reports its rate limit is spent without saying for how long
+RATE_LIMIT_PAUSE = 1.0
+
+# Completed batches held in memory before their progress records are written
+PROGRESS_FLUSH_BATCHES = 50
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """SQLAlchemy connect hook that applies SQLITE_PRAGMAS to a new connection"""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _sqlite_timestamp() -> str:
+    """Current UTC time in the format SQLite's CURRENT_TIMESTAMP uses"""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
 
 
 class HistoricEnglandDatabase:
@@ -38,11 +104,12 @@ class HistoricEnglandDatabase:
     def __init__(self, db_path: str = "historic_england.db"):
         self.db_path = db_path
         self.engine = create_engine(f"sqlite:///{db_path}")
+        event.listen(self.engine, "connect", _apply_sqlite_pragmas)
         self._create_tables()
     
     def _create_tables(self):
         """Create database tables if they don't exist"""
-        with self.engine.connect() as conn:
+        with self.engine.begin() as conn:
             # Main buildings table
             conn.execute(text("""
                 CREATE TABLE IF NOT EXISTS buildings (
@@ -91,11 +158,15 @@ class HistoricEnglandDatabase:
                 )
             """))
             
-            conn.commit()
+            # Lets get_last_processed_offset read MAX(batch_end) for completed batches from the index alone
+            conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS idx_scraping_progress_status
+                ON scraping_progress (status, batch_end)
+            """))
     
     def get_total_count(self) -> Optional[int]:
         """Get total count from database metadata"""
-        with self.engine.connect() as conn:
+        with self.engine.begin() as conn:
             result = conn.execute(text("""
                 SELECT total_count FROM api_metadata 
                 ORDER BY last_updated DESC LIMIT 1
@@ -104,99 +175,87 @@ class HistoricEnglandDatabase:
     
     def update_metadata(self, total_count: int, batch_size: int, status: str):
         """Update API metadata"""
-        with self.engine.connect() as conn:
+        with self.engine.begin() as conn:
             conn.execute(text("""
                 INSERT INTO api_metadata (total_count, batch_size, status)
                 VALUES (:total_count, :batch_size, :status)
             """), {"total_count": total_count, "batch_size": batch_size, "status": status})
-            conn.commit()
     
     def get_last_processed_offset(self) -> int:
         """Get the last successfully processed offset"""
-        with self.engine.connect() as conn:
+        with self.engine.begin() as conn:
             result = conn.execute(text("""
                 SELECT MAX(batch_end) FROM scraping_progress 
                 WHERE status = 'completed'
             """)).fetchone()
             return result[0] if result[0] else 0
     
-    def start_batch(self, batch_start: int, batch_end: int) -> int:
-        """Start tracking a new batch"""
-        with self.engine.connect() as conn:
-            result =             conn.execute(text("""
+    def record_batches(self, batches: List[Dict[str, Any]]):
+        """Write completed batch records to scraping_progress in one executemany"""
+        if not batches:
+            return
+        with self.engine.begin() as conn:
+            conn.execute(text("""
                 INSERT INTO scraping_progress 
-                (batch_start, batch_end, records_processed, success_count, error_count, started_at, status)
-                VALUES (:batch_start, :batch_end, 0, 0, 0, CURRENT_TIMESTAMP, 'in_progress')
-            """), {"batch_start": batch_start, "batch_end": batch_end})
-            conn.commit()
-            return result.lastrowid
+                (batch_start, batch_end, records_processed, success_count, error_count, started_at, completed_at, status)
+                VALUES (:batch_start, :batch_end, :records_processed, :success_count, :error_count, 
+                        :started_at, :completed_at, 'completed')
+            """), batches)
     
-    def complete_batch(self, batch_id: int, records_processed: int, success_count: int, error_count: int):
-        """Mark a batch as completed"""
-        with self.engine.connect() as conn:
-            conn.execute(text("""
-                UPDATE scraping_progress 
-                SET records_processed = :records_processed, success_count = :success_count, error_count = :error_count, 
-                    completed_at = CURRENT_TIMESTAMP, status = 'completed'
-                WHERE id = :batch_id
-            """), {"records_processed": records_processed, "success_count": success_count, "error_count": error_count, "batch_id": batch_id})
-            conn.commit()
+    def _building_row(self, building_data: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Positional parameters for INSERT_BUILDING_SQL"""
+        return tuple(building_data.get(column) for column in BUILDING_COLUMNS)
     
-    def insert_building(self, building_data: Dict[str, Any]) -> bool:
-        """Insert a single building record"""
+    def _insert_row(self, row: Tuple[Any, ...]) -> bool:
+        """Insert one row of INSERT_BUILDING_SQL parameters"""
         try:
-            with self.engine.connect() as conn:
-                conn.execute(text("""
-                    INSERT OR REPLACE INTO buildings 
-                    (name, grade, list_entry, list_date, amend_date, category, ngr, 
-                     easting, northing, capture_scale, longitude, latitude, hyperlink, scraped_at)
-                    VALUES (:name, :grade, :list_entry, :list_date, :amend_date, :category, :ngr, 
-                            :easting, :northing, :capture_scale, :longitude, :latitude, :hyperlink, :scraped_at)
-                """), {
-                    "name": building_data.get('name'),
-                    "grade": building_data.get('grade'),
-                    "list_entry": building_data.get('list_entry'),
-                    "list_date": building_data.get('list_date'),
-                    "amend_date": building_data.get('amend_date'),
-                    "category": building_data.get('category'),
-                    "ngr": building_data.get('ngr'),
-                    "easting": building_data.get('easting'),
-                    "northing": building_data.get('northing'),
-                    "capture_scale": building_data.get('capture_scale'),
-                    "longitude": building_data.get('longitude'),
-                    "latitude": building_data.get('latitude'),
-                    "hyperlink": building_data.get('hyperlink'),
-                    "scraped_at": datetime.now().isoformat()
-                })
-                conn.commit()
+            with self.engine.begin() as conn:
+                conn.exec_driver_sql(INSERT_BUILDING_SQL, row)
                 return True
         except Exception as e:
-            print(f"❌ Error inserting building {building_data.get('list_entry')}: {e}")
+            logger.warning("insert failed list_entry=%s: %s", row[LIST_ENTRY_INDEX], e)
             return False
     
+    def insert_building(self, building_data: Dict[str, Any]) -> bool:
+        """Insert a single building record"""
+        return self._insert_row(self._building_row(building_data))
+    
+    def insert_buildings_bulk(self, rows: List[Tuple[Any, ...]]) -> Tuple[int, int]:
+        """
+        Insert a batch of building rows, in BUILDING_COLUMNS order, in one executemany and one transaction.
+        
+        If the batch fails as a whole, its rows are retried one at a time so the bad ones can be counted.
+        Returns (success_count, error_count).
+        """
+        try:
+            with self.engine.begin() as conn:
+                conn.exec_driver_sql(INSERT_BUILDING_SQL, rows)
+            return len(rows), 0
+        except Exception as e:
+            logger.warning("bulk insert failed (%s), retrying %d rows individually", e, len(rows))
+        
+        success_count = sum(1 for row in rows if self._insert_row(row))
+        return success_count, len(rows) - success_count
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get database statistics"""
-        with self.engine.connect() as conn:
-            # Total buildings
-            total_buildings = conn.execute(text("SELECT COUNT(*) FROM buildings")).fetchone()[0]
-            
-            # By grade
+        with self.engine.begin() as conn:
+            # One scan of the table gives the per-grade counts and recent activity together
             grade_stats = conn.execute(text("""
-                SELECT grade, COUNT(*) as count 
+                SELECT grade, COUNT(*) as count, 
+                       SUM(created_at > datetime('now', '-1 day')) as recent 
                 FROM buildings 
                 GROUP BY grade 
                 ORDER BY count DESC
             """)).fetchall()
             
-            # Recent activity
-            recent_activity = conn.execute(text("""
-                SELECT COUNT(*) FROM buildings 
-                WHERE created_at > datetime('now', '-1 day')
-            """)).fetchone()[0]
+            # Every row falls in exactly one grade group, so the totals are sums over the groups
+            total_buildings = sum(count for _, count, _ in grade_stats)
+            recent_activity = sum(recent or 0 for _, _, recent in grade_stats)
             
             return {
                 'total_buildings': total_buildings,
-                'grade_distribution': dict(grade_stats),
+                'grade_distribution': {grade: count for grade, count, _ in grade_stats},
                 'recent_activity': recent_activity
             }
 
@@ -204,11 +263,39 @@ class HistoricEnglandDatabase:
 class DatabaseScraper:
     """Main scraper class for fetching all API data to database"""
     
-    def __init__(self, db_path: str = "historic_england.db", batch_size: int = 1000):
+    def __init__(self, db_path: str = "historic_england.db", batch_size: int = 1000, concurrency: int = 4):
         self.db = HistoricEnglandDatabase(db_path)
+        self.concurrency = concurrency
+        # Every count and batch request reuses this client's pooled, retrying HTTPS session. It is the scraper's
+        # own rather than the shared default, which caches responses when NHLE_API_CACHE is set: a full-layer
+        # scrape would fill the cache file with every page, and a resume could read pages up to an hour old
         self.api_client = NHLEAPIClient()
         self.batch_size = batch_size
         self.base_url = "https://services-eu1.arcgis.com/ZOdPfBS3aqqDYPUQ/arcgis/rest/services/National_Heritage_List_for_England_NHLE_v02_VIEW/FeatureServer/0/query"
+        # Batch fetches only wait when the API's rate limit headers ask them to; 429/5xx retries with
+        # backoff (honouring Retry-After) are already handled by the session's adapter
+        self._next_request_at = 0.0
+        self._rate_limit_lock = threading.Lock()
+    
+    def _wait_for_rate_limit(self):
+        """Sleep until any pause requested by the API has passed"""
+        delay = self._next_request_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+    
+    def _note_rate_limit(self, response):
+        """Hold back further batch requests if the response says the rate limit is spent"""
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is None and response.headers.get('X-RateLimit-Remaining') != '0':
+            return
+        
+        try:
+            delay = float(retry_after)
+        except (TypeError, ValueError):
+            delay = RATE_LIMIT_PAUSE
+        
+        with self._rate_limit_lock:
+            self._next_request_at = max(self._next_request_at, time.monotonic() + delay)
     
     def get_total_count(self) -> Optional[int]:
         """Get total count of buildings from API"""
@@ -219,72 +306,94 @@ class DatabaseScraper:
                 'f': 'json'
             }
             
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = self.api_client.session.get(self.base_url, params=params, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
             
             return data.get('count')
         except Exception as e:
             print(f"❌ Error getting total count: {e}")
             return None
     
-    def convert_timestamp(self, timestamp_ms: Optional[int]) -> Optional[str]:
-        """Convert Unix timestamp in milliseconds to readable date format"""
-        if timestamp_ms is None:
-            return None
-        try:
-            dt = datetime.fromtimestamp(timestamp_ms / 1000)
-            return dt.strftime('%d-%b-%Y')
-        except:
-            return None
-    
-    def fetch_batch(self, offset: int, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+    def fetch_batch(self, offset: int, limit: int) -> Tuple[List[Tuple[Any, ...]], int]:
         """Fetch a batch of buildings from the API"""
         try:
             params = {
                 'where': '1=1',
-                'outFields': '*',
+                'outFields': BATCH_FIELDS,
                 'returnGeometry': 'true',
+                'geometryPrecision': 6,
+                # Paging by offset is only stable over a fixed order, so resumed runs neither skip nor repeat rows
+                'orderByFields': 'OBJECTID ASC',
                 'f': 'json',
                 'resultOffset': offset,
                 'resultRecordCount': limit
             }
             
-            response = requests.get(self.base_url, params=params, timeout=60)
+            self._wait_for_rate_limit()
+            response = self.api_client.session.get(self.base_url, params=params, timeout=60)
+            self._note_rate_limit(response)
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
             
             if 'features' not in data:
                 return [], 0
             
+            # Listing and amendment dates repeat heavily across a batch, so each distinct timestamp is formatted once
+            timestamps = {feature.get('attributes', {}).get(field)
+                          for feature in data['features'] for field in ('ListDate', 'AmendDate')}
+            dates = {timestamp_ms: convert_timestamp(timestamp_ms) for timestamp_ms in timestamps}
+            
+            # Rows go straight to insert_buildings_bulk, in BUILDING_COLUMNS order; an omitted attribute is stored as None
             buildings = []
             for feature in data['features']:
                 attrs = feature.get('attributes', {})
-                geometry = feature.get('geometry', {})
+                (name, grade, list_entry, list_date, amend_date, ngr,
+                 easting, northing, capture_scale, hyperlink) = (attrs.get(field) for field in BATCH_ATTRIBUTES)
+                geometry = feature.get('geometry')
+                longitude, latitude = (geometry.get('x'), geometry.get('y')) if geometry else (None, None)
                 
-                building = {
-                    'name': attrs.get('Name'),
-                    'grade': attrs.get('Grade'),
-                    'list_entry': attrs.get('ListEntry'),
-                    'list_date': self.convert_timestamp(attrs.get('ListDate')),
-                    'amend_date': self.convert_timestamp(attrs.get('AmendDate')),
-                    'category': attrs.get('Category'),
-                    'ngr': attrs.get('NGR'),
-                    'easting': attrs.get('Easting'),
-                    'northing': attrs.get('Northing'),
-                    'capture_scale': attrs.get('CaptureScale'),
-                    'longitude': geometry.get('x') if geometry else None,
-                    'latitude': geometry.get('y') if geometry else None,
-                    'hyperlink': attrs.get('hyperlink')
-                }
-                buildings.append(building)
+                buildings.append((name, grade, list_entry, dates[list_date], dates[amend_date], None, ngr,
+                                  easting, northing, capture_scale, longitude, latitude, hyperlink))
             
             return buildings, len(buildings)
             
         except Exception as e:
-            print(f"❌ Error fetching batch at offset {offset}: {e}")
+            logger.warning("fetch failed offset=%s: %s", offset, e)
             return [], 0
     
+    def iter_batches(self, offsets: List[int]) -> Iterator[Tuple[int, str, Tuple[List[Tuple[Any, ...]], int]]]:
+        """
+        Fetch batches on `concurrency` worker threads, yielding (offset, started_at, fetch_batch result) in
+        offset order, where started_at is when the batch's fetch was submitted.
+        
+        Only a few batches are fetched ahead of the caller, so memory stays bounded while it writes to the database.
+        """
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            pending = deque()
+            for offset in offsets:
+                pending.append((offset, _sqlite_timestamp(), executor.submit(self.fetch_batch, offset, self.batch_size)))
+                if len(pending) > self.concurrency:
+                    offset, started_at, future = pending.popleft()
+                    yield offset, started_at, future.result()
+            
+            while pending:
+                offset, started_at, future = pending.popleft()
+                yield offset, started_at, future.result()
+    
+    def _batch_record(self, batch_start: int, batch_end: int, started_at: str, records_processed: int,
+                      success_count: int, error_count: int) -> Dict[str, Any]:
+        """Progress record for one finished batch, completed now"""
+        return {
+            "batch_start": batch_start,
+            "batch_end": batch_end,
+            "records_processed": records_processed,
+            "success_count": success_count,
+            "error_count": error_count,
+            "started_at": started_at,
+            "completed_at": _sqlite_timestamp()
+        }
+    
     def scrape_all(self, resume: bool = False) -> bool:
         """Scrape all available data"""
         print("🏛️  Historic England Database Scraper")
@@ -320,47 +429,43 @@ class DatabaseScraper:
         error_count = 0
         processed_count = 0
         
-        with tqdm(total=total_count - start_offset, desc="Processing buildings", unit="buildings") as pbar:
-            for batch_num in range(total_batches):
-                batch_start = start_offset + (batch_num * self.batch_size)
-                batch_end = min(batch_start + self.batch_size - 1, total_count - 1)
-                
-                # Start tracking this batch
-                batch_id = self.db.start_batch(batch_start, batch_end)
-                
-                # Fetch batch
-                buildings, fetched_count = self.fetch_batch(batch_start, self.batch_size)
-                
-                if not buildings:
-                    print(f"⚠️  No data returned for batch {batch_num + 1}")
-                    self.db.complete_batch(batch_id, 0, 0, 1)
-                    error_count += 1
-                    continue
-                
-                # Insert buildings
-                batch_success = 0
-                batch_errors = 0
-                
-                for building in buildings:
-                    if self.db.insert_building(building):
-                        batch_success += 1
-                        success_count += 1
-                    else:
-                        batch_errors += 1
+        # Later batches download while earlier ones are written
+        offsets = [start_offset + (batch_num * self.batch_size) for batch_num in range(total_batches)]
+        
+        # Batch progress is kept in memory and written every PROGRESS_FLUSH_BATCHES batches, and once
+        # more on the way out. Each batch's buildings commit on their own, ahead of its progress record,
+        # so a crash can leave inserted buildings with no record; resume then fetches those batches
+        # again, and the upsert makes re-inserting their buildings harmless
+        batch_records = []
+        
+        try:
+            with tqdm(total=total_count - start_offset, desc="Processing buildings", unit="buildings") as pbar:
+                for batch_num, (batch_start, started_at, (buildings, fetched_count)) in enumerate(self.iter_batches(offsets)):
+                    batch_end = min(batch_start + self.batch_size - 1, total_count - 1)
+                    
+                    if not buildings:
+                        tqdm.write(f"⚠️  No data returned for batch {batch_num + 1}")
+                        batch_records.append(self._batch_record(batch_start, batch_end, started_at, 0, 0, 1))
                         error_count += 1
+                        continue
                     
-                    processed_count += 1
-                    pbar.update(1)
-                
-                # Complete batch tracking
-                self.db.complete_batch(batch_id, fetched_count, batch_success, batch_errors)
-                
-                # Progress update
-                if (batch_num + 1) % 10 == 0:
-                    print(f"📊 Batch {batch_num + 1}/{total_batches}: {batch_success} success, {batch_errors} errors")
-                
-                # Small delay to be respectful to the API
-                time.sleep(0.1)
+                    # Insert buildings
+                    batch_success, batch_errors = self.db.insert_buildings_bulk(buildings)
+                    success_count += batch_success
+                    error_count += batch_errors
+                    processed_count += len(buildings)
+                    pbar.update(len(buildings))
+                    
+                    batch_records.append(self._batch_record(batch_start, batch_end, started_at, fetched_count, batch_success, batch_errors))
+                    if len(batch_records) >= PROGRESS_FLUSH_BATCHES:
+                        self.db.record_batches(batch_records)
+                        batch_records.clear()
+                    
+                    # Progress update
+                    if (batch_num + 1) % 10 == 0:
+                        tqdm.write(f"📊 Batch {batch_num + 1}/{total_batches}: {batch_success} success, {batch_errors} errors")
+        finally:
+            self.db.record_batches(batch_records)
         
         # Update final metadata
         self.db.update_metadata(total_count, self.batch_size, 'completed')
@@ -393,10 +498,14 @@ def main():
                        help="Database file path (default: historic_england.db)")
     parser.add_argument("--batch-size", "-b", type=int, default=1000,
                        help="Batch size for API requests (default: 1000)")
+    parser.add_argument("--concurrency", "-c", type=int, default=4,
+                       help="Number of batches to fetch from the API at once (default: 4)")
     parser.add_argument("--resume", "-r", action="store_true",
                        help="Resume from last processed offset")
     parser.add_argument("--stats", "-s", action="store_true",
                        help="Show database statistics and exit")
+    parser.add_argument("--log-file", default="database_scraper.log",
+                       help="File for per-record warnings (default: database_scraper.log)")
     
     args = parser.parse_args()
     
@@ -413,8 +522,15 @@ def main():
         print(f"Recent activity: {stats['recent_activity']:,}")
         return 0
     
+    # Only a scrape writes to the failure log, so --stats leaves the file alone
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(message)s",
+        handlers=[RotatingFileHandler(args.log_file, maxBytes=5 * 1024 * 1024, backupCount=3, encoding="utf-8")]
+    )
+    
     # Create scraper and run
-    scraper = DatabaseScraper(args.database, args.batch_size)
+    scraper = DatabaseScraper(args.database, args.batch_size, args.concurrency)
     
     try:
         success = scraper.scrape_all(resume=args.resume)
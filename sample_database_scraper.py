@@ -17,12 +17,11 @@ import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
-import requests
 from sqlalchemy import create_engine, text
 from tqdm import tqdm
 
 # Import our existing API client
-from shared.api_client import NHLEAPIClient
+from shared.api_client import NHLEAPIClient, convert_timestamp, parse_json
 
 
 class SampleHistoricEnglandDatabase:
@@ -114,16 +113,14 @@ class SampleHistoricEnglandDatabase:
     def get_stats(self) -> Dict[str, Any]:
         """Get database statistics"""
         with self.engine.connect() as conn:
-            # Total buildings
-            total_buildings = conn.execute(text("SELECT COUNT(*) FROM buildings")).fetchone()[0]
-            
-            # By grade
+            # By grade; every row falls in exactly one group, so the total is their sum
             grade_stats = conn.execute(text("""
                 SELECT grade, COUNT(*) as count 
                 FROM buildings 
                 GROUP BY grade 
                 ORDER BY count DESC
             """)).fetchall()
+            total_buildings = sum(count for _, count in grade_stats)
             
             # Sample info
             sample_info = conn.execute(text("""
@@ -144,7 +141,8 @@ class SampleDatabaseScraper:
     
     def __init__(self, db_path: str = "sample_historic_england.db"):
         self.db = SampleHistoricEnglandDatabase(db_path)
-        self.api_client = NHLEAPIClient()
+        # API calls go through the shared client's pooled keep-alive session rather than a new connection each
+        self.api_client = NHLEAPIClient.get_default()
         self.base_url = "https://services-eu1.arcgis.com/ZOdPfBS3aqqDYPUQ/arcgis/rest/services/National_Heritage_List_for_England_NHLE_v02_VIEW/FeatureServer/0/query"
     
     def get_total_count(self) -> Optional[int]:
@@ -156,25 +154,15 @@ class SampleDatabaseScraper:
                 'f': 'json'
             }
             
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = self.api_client.session.get(self.base_url, params=params, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
             
             return data.get('count')
         except Exception as e:
             print(f"❌ Error getting total count: {e}")
             return None
     
-    def convert_timestamp(self, timestamp_ms: Optional[int]) -> Optional[str]:
-        """Convert Unix timestamp in milliseconds to readable date format"""
-        if timestamp_ms is None:
-            return None
-        try:
-            dt = datetime.fromtimestamp(timestamp_ms / 1000)
-            return dt.strftime('%d-%b-%Y')
-        except:
-            return None
-    
     def fetch_sample(self, count: int) -> Tuple[List[Dict[str, Any]], int]:
         """Fetch a sample of buildings from the API"""
         try:
@@ -186,9 +174,9 @@ class SampleDatabaseScraper:
                 'resultRecordCount': count
             }
             
-            response = requests.get(self.base_url, params=params, timeout=60)
+            response = self.api_client.session.get(self.base_url, params=params, timeout=60)
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
             
             if 'features' not in data:
                 return [], 0
@@ -202,8 +190,8 @@ class SampleDatabaseScraper:
                     'name': attrs.get('Name'),
                     'grade': attrs.get('Grade'),
                     'list_entry': attrs.get('ListEntry'),
-                    'list_date': self.convert_timestamp(attrs.get('ListDate')),
-                    'amend_date': self.convert_timestamp(attrs.get('AmendDate')),
+                    'list_date': convert_timestamp(attrs.get('ListDate')),
+                    'amend_date': convert_timestamp(attrs.get('AmendDate')),
                     'category': attrs.get('Category'),
                     'ngr': attrs.get('NGR'),
                     'easting': attrs.get('Easting'),
@@ -3,185 +3,521 @@
 Shared API client for Historic England NHLE API
 """
 
+import json
+import os
 import random
+import re
+import socket
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+    _PARSE_ERRORS = (ValueError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _PARSE_ERRORS = (ValueError,)
 
 # NHLE API endpoint
 NHLE_BASE_URL = "https://services-eu1.arcgis.com/ZOdPfBS3aqqDYPUQ/arcgis/rest/services/National_Heritage_List_for_England_NHLE_v02_VIEW/FeatureServer"
 
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# (connect, read) seconds for NHLE API requests: fail fast on an unreachable host,
+# but give the FeatureServer time to run larger queries
+DEFAULT_TIMEOUT = (3.05, 30)
+
+# When set, the shared default client caches responses on disk in this SQLite file,
+# so repeat development runs read identical queries locally instead of re-fetching them
+CACHE_ENV_VAR = 'NHLE_API_CACHE'
+
+# Largest page the FeatureServer layer returns for a single query
+MAX_RECORDS_PER_QUERY = 1000
+
+# Seconds to keep the layer's object ID list; listings change slowly, so it can be reused for a day
+OBJECT_IDS_TTL = 86400
+
+# Failures worth reporting and recovering from; anything else is a bug and should surface
+API_ERRORS = (requests.exceptions.RequestException,) + _PARSE_ERRORS
+
+# Static statistics definition for count_buildings, serialised once rather than per call
+GRADE_COUNT_STATISTICS = json.dumps([{
+    'statisticType': 'count',
+    'onStatisticField': 'ListEntry',
+    'outStatisticFieldName': 'building_count'
+}])
+
+# (result key, API attribute, default) for the building records returned by the client
+BUILDING_FIELDS = (
+    ('name', 'Name', 'Unnamed'),
+    ('grade', 'Grade', 'N/A'),
+    ('list_entry', 'ListEntry', 'N/A'),
+    ('list_date', 'ListDate', 'N/A'),
+    ('amend_date', 'AmendDate', 'N/A'),
+    ('capture_scale', 'CaptureScale', 'N/A'),
+    ('hyperlink', 'hyperlink', ''),
+    ('ngr', 'NGR', 'N/A'),
+    ('easting', 'Easting', 'N/A'),
+    ('northing', 'Northing', 'N/A')
+)
+
+# API fields requested for building records when the caller does not choose its own
+DEFAULT_FIELDS = ['Name', 'Grade', 'ListEntry', 'ListDate', 'hyperlink', 'NGR', 'Easting', 'Northing', 'AmendDate', 'CaptureScale']
+
+# Month names for convert_timestamp's DD-MMM-YYYY dates
+MONTH_ABBREVIATIONS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+SEARCH_RESULT_FIELDS = (
+    ('name', 'Name', 'Unnamed'),
+    ('grade', 'Grade', 'N/A'),
+    ('list_entry', 'ListEntry', 'N/A'),
+    ('hyperlink', 'hyperlink', '')
+)
+
+
+def parse_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def convert_timestamp(timestamp_ms: Optional[int]) -> Optional[str]:
+    """Convert an API date (Unix timestamp in milliseconds) to DD-MMM-YYYY, or None if it is missing or invalid"""
+    if timestamp_ms is None:
+        return None
+    try:
+        dt = datetime.fromtimestamp(timestamp_ms / 1000)
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+    # Formatted by hand: %b follows the process locale, and the API dates are always English
+    return f"{dt.day:02d}-{MONTH_ABBREVIATIONS[dt.month - 1]}-{dt.year}"
+
+
+def _name_contains_clause(term: str) -> str:
+    """Case-insensitive `Name contains term` SQL condition, with quotes in the term escaped"""
+    term = term.replace("'", "''")
+    return f"UPPER(Name) LIKE UPPER('%{term}%')"
+
+
+def _like_regex(term: str) -> re.Pattern:
+    """Regex matching the upper-cased names _name_contains_clause(term) matches, honouring % and _ in the term"""
+    return re.compile('.*'.join('.'.join(re.escape(piece) for piece in part.split('_'))
+                                for part in term.upper().split('%')), re.DOTALL)
+
+
+def _map_attributes(attrs: Dict[str, Any], fields: Tuple[Tuple[str, str, Any], ...]) -> Dict[str, Any]:
+    """Map raw API attributes onto result keys in one pass"""
+    return {key: attrs.get(field, default) for key, field, default in fields}
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter that turns on TCP keep-alive so idle pooled connections are not dropped between calls"""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        socket_options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        if hasattr(socket, 'TCP_KEEPIDLE'):
+            socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60))
+        kwargs['socket_options'] = socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+def create_session(cache_name: Optional[str] = None, cache_expire_after: int = 3600) -> requests.Session:
+    """
+    Create a pooled session so repeated NHLE calls reuse one TCP/TLS connection.
+    
+    If cache_name is given and requests-cache is installed, GET responses are
+    cached on disk in a SQLite file of that name for cache_expire_after seconds.
+    """
+    session = None
+    if cache_name:
+        try:
+            import requests_cache
+            session = requests_cache.CachedSession(cache_name, backend='sqlite', expire_after=cache_expire_after)
+        except ImportError:
+            print("⚠️  requests-cache not installed, responses will not be cached (pip install requests-cache)")
+    
+    if session is None:
+        session = requests.Session()
+    
+    adapter = KeepAliveAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=3,
+            connect=3,
+            read=3,
+            status=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET'],
+            respect_retry_after_header=True
+        )
+    )
+    session.mount('https://', adapter)
+    session.headers.update({'User-Agent': USER_AGENT})
+    return session
+
+# Shared instance handed out by NHLEAPIClient.get_default()
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
 class NHLEAPIClient:
     """Client for interacting with the Historic England NHLE API"""
     
-    def __init__(self):
+    def __init__(self, timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT, cache_name: Optional[str] = None,
+                 cache_expire_after: int = 3600):
         self.base_url = NHLE_BASE_URL
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
+        self.query_url = f"{NHLE_BASE_URL}/0/query"
+        self.timeout = timeout
+        self.session = create_session(cache_name, cache_expire_after)
+        self._object_ids = None
+        self._object_ids_fetched_at = 0.0
+        self._total_count = None
+        self._total_count_fetched_at = 0.0
+    
+    @classmethod
+    def get_default(cls) -> 'NHLEAPIClient':
+        """
+        Return the process-wide client, creating it on first use so all callers share one connection pool.
+        
+        Set the NHLE_API_CACHE environment variable to a file name to give it an on-disk response cache.
+        """
+        global _default_client
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = cls(cache_name=os.environ.get(CACHE_ENV_VAR) or None)
+            return _default_client
+    
+    def __enter__(self) -> 'NHLEAPIClient':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close the underlying session and its pooled connections"""
+        global _default_client
+        with _default_client_lock:
+            if _default_client is self:
+                _default_client = None
+        self.session.close()
+    
+    def clear_cache(self):
+        """Drop cached responses so the next calls hit the API again"""
+        cache = getattr(self.session, 'cache', None)
+        if cache is not None:
+            cache.clear()
+    
+    def query_features(self, params: Dict[str, Any], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Run a layer query and return its features, or only the first `limit` of them"""
+        # Stream large pages through ijson so the raw body and parsed envelope are never both held in memory.
+        # Cached sessions hand back an already-read body, so parse those normally.
+        if ijson is None or hasattr(self.session, 'cache'):
+            response = self.session.get(self.query_url, params=params, timeout=self.timeout)
+            response.raise_for_status()
+            features = parse_json(response).get('features') or []
+            return features[:limit] if limit is not None else features
+        
+        with self.session.get(self.query_url, params=params, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            return list(islice(ijson.items(response.raw, 'features.item', use_float=True), limit))
     
     def get_api_info(self) -> Optional[Dict[str, Any]]:
         """Get basic information about the API"""
         try:
-            response = self.session.get(self.base_url, params={'f': 'json'})
+            response = self.session.get(self.base_url, params={'f': 'json'}, timeout=self.timeout)
             response.raise_for_status()
-            return response.json()
-        except Exception as e:
+            return parse_json(response)
+        except API_ERRORS as e:
             print(f"❌ Error getting API info: {e}")
             return None
     
     def count_buildings(self) -> Tuple[Optional[int], Optional[Dict[str, int]]]:
         """Count total listed buildings and by grade"""
         try:
-            layer_url = f"{self.base_url}/0/query"
+            # One group-by statistics query returns every grade's count at once
             params = {
                 'where': '1=1',
-                'returnCountOnly': 'true',
-                'f': 'json'
+                'groupByFieldsForStatistics': 'Grade',
+                'outStatistics': GRADE_COUNT_STATISTICS,
+                'f': 'json',
+                'cacheHint': 'true'
             }
             
-            response = self.session.get(layer_url, params=params)
+            response = self.session.get(self.query_url, params=params, timeout=self.timeout)
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
             
-            if 'count' not in data:
+            if 'features' not in data:
                 return None, None
             
-            total_count = data['count']
-            
-            # Get count by grade
-            grades = ['I', 'II*', 'II']
+            # Accumulate the total and the listed grades in the same pass over the groups
+            grades = ('I', 'II*', 'II')
+            total_count = 0
             grade_counts = {}
+            for feature in data['features']:
+                attrs = feature.get('attributes', {})
+                count = attrs.get('building_count', 0)
+                total_count += count
+                if attrs.get('Grade') in grades:
+                    grade_counts[attrs['Grade']] = count
             
-            for grade in grades:
-                params = {
-                    'where': f"Grade = '{grade}'",
-                    'returnCountOnly': 'true',
-                    'f': 'json'
-                }
-                
-                response = self.session.get(layer_url, params=params)
-                response.raise_for_status()
-                data = response.json()
-                
-                if 'count' in data:
-                    grade_counts[grade] = data['count']
+            # Keep the I / II* / II ordering regardless of the order groups come back in
+            grade_counts = {grade: grade_counts[grade] for grade in grades if grade in grade_counts}
             
             return total_count, grade_counts
             
-        except Exception as e:
+        except API_ERRORS as e:
             print(f"❌ Error counting buildings: {e}")
             return None, None
     
     def get_buildings(self, count: int = 5, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Get buildings from the API"""
         if fields is None:
-            fields = ['Name', 'Grade', 'ListEntry', 'ListDate', 'hyperlink', 'NGR', 'Easting', 'Northing', 'AmendDate', 'CaptureScale']
+            fields = DEFAULT_FIELDS
         
         try:
-            layer_url = f"{self.base_url}/0/query"
             params = {
                 'where': '1=1',
                 'outFields': ','.join(fields),
                 'returnGeometry': 'false',
                 'f': 'json',
+                'cacheHint': 'true',
                 'resultRecordCount': count
             }
             
-            response = self.session.get(layer_url, params=params)
+            features = self.query_features(params)
+            return [_map_attributes(feature.get('attributes', {}), BUILDING_FIELDS) for feature in features]
+            
+        except API_ERRORS as e:
+            print(f"❌ Error getting buildings: {e}")
+            return []
+    
+    def get_object_ids(self) -> List[int]:
+        """Get every object ID in the layer, reusing the list for OBJECT_IDS_TTL seconds"""
+        if self._object_ids and time.time() - self._object_ids_fetched_at < OBJECT_IDS_TTL:
+            return self._object_ids
+        
+        try:
+            params = {
+                'where': '1=1',
+                'returnIdsOnly': 'true',
+                'f': 'json'
+            }
+            
+            response = self.session.get(self.query_url, params=params, timeout=self.timeout)
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
             
-            if 'features' not in data or not data['features']:
-                return []
+            self._object_ids = data.get('objectIds') or []
+            self._object_ids_fetched_at = time.time()
+            return self._object_ids
             
-            buildings = []
-            for feature in data['features']:
-                attrs = feature.get('attributes', {})
-                building = {
-                    'name': attrs.get('Name', 'Unnamed'),
-                    'grade': attrs.get('Grade', 'N/A'),
-                    'list_entry': attrs.get('ListEntry', 'N/A'),
-                    'list_date': attrs.get('ListDate', 'N/A'),
-                    'amend_date': attrs.get('AmendDate', 'N/A'),
-                    'capture_scale': attrs.get('CaptureScale', 'N/A'),
-                    'hyperlink': attrs.get('hyperlink', ''),
-                    'ngr': attrs.get('NGR', 'N/A'),
-                    'easting': attrs.get('Easting', 'N/A'),
-                    'northing': attrs.get('Northing', 'N/A')
+        except API_ERRORS as e:
+            print(f"❌ Error getting object IDs: {e}")
+            return []
+    
+    def get_random_buildings(self, count: int, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Get several distinct random buildings, fetching them together by object ID"""
+        if fields is None:
+            fields = DEFAULT_FIELDS
+        
+        object_ids = self.get_object_ids()
+        if not object_ids:
+            return []
+        
+        chosen = random.sample(object_ids, min(count, len(object_ids)))
+        buildings = []
+        
+        try:
+            # The layer returns at most MAX_RECORDS_PER_QUERY features per request
+            for start in range(0, len(chosen), MAX_RECORDS_PER_QUERY):
+                params = {
+                    'objectIds': ','.join(str(oid) for oid in chosen[start:start + MAX_RECORDS_PER_QUERY]),
+                    'outFields': ','.join(fields),
+                    'returnGeometry': 'false',
+                    'f': 'json'
                 }
-                buildings.append(building)
+                
+                features = self.query_features(params)
+                buildings.extend(_map_attributes(feature.get('attributes', {}), BUILDING_FIELDS) for feature in features)
             
             return buildings
             
-        except Exception as e:
-            print(f"❌ Error getting buildings: {e}")
-            return []
+        except API_ERRORS as e:
+            print(f"❌ Error getting random buildings: {e}")
+            return buildings
+    
+    def get_total_count(self) -> Optional[int]:
+        """Get the number of records in the layer, reusing it for OBJECT_IDS_TTL seconds"""
+        if self._total_count and time.time() - self._total_count_fetched_at < OBJECT_IDS_TTL:
+            return self._total_count
+        
+        try:
+            params = {
+                'where': '1=1',
+                'returnCountOnly': 'true',
+                'f': 'json'
+            }
+            
+            response = self.session.get(self.query_url, params=params, timeout=self.timeout)
+            response.raise_for_status()
+            
+            self._total_count = parse_json(response).get('count')
+            self._total_count_fetched_at = time.time()
+            return self._total_count
+            
+        except API_ERRORS as e:
+            print(f"❌ Error getting total count: {e}")
+            return None
     
     def get_random_building(self, fields: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
         """Get a random building from the API"""
-        buildings = self.get_buildings(5, fields)
-        return random.choice(buildings) if buildings else None
+        if fields is None:
+            fields = DEFAULT_FIELDS
+        
+        # A random offset into the layer needs only a count, not the full object ID list
+        total_count = self.get_total_count()
+        if not total_count:
+            return None
+        
+        try:
+            params = {
+                'where': '1=1',
+                'outFields': ','.join(fields),
+                'returnGeometry': 'false',
+                'orderByFields': 'OBJECTID',
+                'resultOffset': random.randrange(total_count),
+                'resultRecordCount': 1,
+                'f': 'json'
+            }
+            
+            features = self.query_features(params)
+            return _map_attributes(features[0].get('attributes', {}), BUILDING_FIELDS) if features else None
+            
+        except API_ERRORS as e:
+            print(f"❌ Error getting random building: {e}")
+            return None
     
     def search_buildings(self, search_term: str, limit: int = 5) -> List[Dict[str, Any]]:
         """Search for buildings by name"""
         try:
-            layer_url = f"{self.base_url}/0/query"
             params = {
-                'where': f"UPPER(Name) LIKE UPPER('%{search_term}%')",
+                'where': _name_contains_clause(search_term),
                 'outFields': 'Name,Grade,ListEntry,hyperlink',
                 'returnGeometry': 'false',
                 'f': 'json',
+                'cacheHint': 'true',
                 'resultRecordCount': limit
             }
             
-            response = self.session.get(layer_url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            features = self.query_features(params)
+            return [_map_attributes(feature.get('attributes', {}), SEARCH_RESULT_FIELDS) for feature in features]
             
-            if 'features' not in data or not data['features']:
-                return []
+        except API_ERRORS as e:
+            print(f"❌ Error searching buildings: {e}")
+            return []
+    
+    def search_buildings_multi(self, search_terms: Iterable[str], limit_per_term: int = 5) -> Dict[str, List[Dict[str, Any]]]:
+        """Search for buildings matching any of several names in a single request"""
+        # Duplicates would only repeat a condition, and a generator could only be read once
+        search_terms = list(dict.fromkeys(search_terms))
+        results = {term: [] for term in search_terms}
+        if not search_terms:
+            return results
+        
+        try:
+            record_count = limit_per_term * len(search_terms)
+            params = {
+                'where': ' OR '.join(_name_contains_clause(term) for term in search_terms),
+                'outFields': 'Name,Grade,ListEntry,hyperlink',
+                'returnGeometry': 'false',
+                'orderByFields': 'Name',
+                'f': 'json',
+                'cacheHint': 'true',
+                'resultRecordCount': record_count
+            }
             
-            buildings = []
-            for feature in data['features']:
+            features = self.query_features(params)
+            
+            # Bucket each match under every term whose LIKE pattern its name matches
+            patterns = [(term, _like_regex(term)) for term in search_terms]
+            for feature in features:
                 attrs = feature.get('attributes', {})
-                building = {
-                    'name': attrs.get('Name', 'Unnamed'),
-                    'grade': attrs.get('Grade', 'N/A'),
-                    'list_entry': attrs.get('ListEntry', 'N/A'),
-                    'hyperlink': attrs.get('hyperlink', '')
-                }
-                buildings.append(building)
+                name = (attrs.get('Name') or '').upper()
+                for term, pattern in patterns:
+                    if pattern.search(name) and len(results[term]) < limit_per_term:
+                        results[term].append(_map_attributes(attrs, SEARCH_RESULT_FIELDS))
             
-            return buildings
+            # A full page may have been crowded out by one common term, so query the short buckets on their own
+            if len(features) >= record_count:
+                for term in search_terms:
+                    if len(results[term]) < limit_per_term:
+                        results[term] = self.search_buildings(term, limit_per_term)
             
-        except Exception as e:
+            return results
+            
+        except API_ERRORS as e:
             print(f"❌ Error searching buildings: {e}")
-            return []
+            return results
     
     def get_all_fields(self) -> List[str]:
         """Get all available fields from the API"""
         try:
-            layer_url = f"{self.base_url}/0/query"
+            # A query matching nothing still returns the field schema, without any feature values
             params = {
-                'where': '1=1',
+                'where': '1=0',
                 'outFields': '*',
                 'returnGeometry': 'false',
-                'f': 'json',
-                'resultRecordCount': 1
+                'f': 'json'
             }
             
-            response = self.session.get(layer_url, params=params)
+            response = self.session.get(self.query_url, params=params, timeout=self.timeout)
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
             
-            if 'features' in data and data['features']:
-                return list(data['features'][0].get('attributes', {}).keys())
+            if data.get('fields'):
+                return [field['name'] for field in data['fields']]
             
             return []
             
-        except Exception as e:
+        except API_ERRORS as e:
             print(f"❌ Error getting fields: {e}")
             return []
+    
+    def get_overview(self, sample_count: int = 5, search_terms: Tuple[str, ...] = ('castle', 'church'),
+                     search_limit: int = 3) -> Dict[str, Any]:
+        """Fetch API info, counts, sample buildings and searches concurrently"""
+        # The calls are independent, so overlap their network waits instead of running them in sequence
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            info_future = executor.submit(self.get_api_info)
+            counts_future = executor.submit(self.count_buildings)
+            sample_future = executor.submit(self.get_buildings, sample_count)
+            searches_future = executor.submit(self.search_buildings_multi, list(search_terms), search_limit)
+        
+        total_count, grade_counts = counts_future.result()
+        
+        return {
+            'api_info': info_future.result(),
+            'total_count': total_count,
+            'grade_counts': grade_counts,
+            'sample_buildings': sample_future.result(),
+            'searches': searches_future.result()
+        }
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Shared rate limiter for pacing requests to Historic England services
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Token bucket allowing `rate` calls per second on average, with bursts of up to `burst` calls"""
+    
+    def __init__(self, rate: float, burst: int = 1):
+        self.interval = 1.0 / rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until another call is allowed; returns immediately while callers stay under the rate"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) / self.interval)
+            self._updated = now
+            
+            # Reserve a token now and sleep outside the lock, so waiting callers queue in order
+            self._tokens -= 1
+            delay = -self._tokens * self.interval if self._tokens < 0 else 0
+        
+        if delay:
+            time.sleep(delay)
@@ -3,30 +3,223 @@
 Shared web scraper for Historic England pages
 """
 
+import base64
+import json
 import re
+import sys
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from multiprocessing.util import Finalize
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+import requests
+from bs4 import BeautifulSoup, Tag
+
+from .api_client import DEFAULT_TIMEOUT, create_session, orjson
+from .rate_limiter import RateLimiter
+
+# Selenium is only needed for the browser fallback, so the scraper still imports without it
+try:
+    from selenium import webdriver
+    from selenium.common.exceptions import WebDriverException
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+except ImportError:
+    webdriver = None
+
+# Parse with libxml2 when lxml is installed; it is several times faster than the pure-Python parser
+try:
+    import lxml
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Site root that relative image and link URLs are resolved against
+SITE_URL = 'https://historicengland.org.uk'
+
+# Elements collected by _extract_elements, gathered in one document-order walk
+CONTENT_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'img', 'a']
+
+# Cookie-banner text to leave out of extracted headings and paragraphs; searching avoids lowercasing each string
+COOKIE_RE = re.compile('cookie', re.I)
+
+# Patterns for _extract_building_specific_data, compiled once and tried in order of preference
+GRADE_PATTERNS = tuple(re.compile(pattern, re.I) for pattern in (
+    r'Grade\s+([I2*]+)',
+    r'Grade\s*:\s*([I2*]+)',
+    r'([I2*]+)\s*Grade'
+))
+
+ENTRY_PATTERNS = tuple(re.compile(pattern, re.I) for pattern in (
+    r'List Entry\s*[:\s]*(\d+)',
+    r'Entry\s*[:\s]*(\d+)',
+    r'(\d{6,})'
+))
+
+COORD_PATTERNS = tuple(re.compile(pattern, re.I) for pattern in (
+    r'National Grid Reference[:\s]*([A-Z]{2}\s?\d{4,6}\s?\d{4,6})',
+    r'NGR[:\s]*([A-Z]{2}\s?\d{4,6}\s?\d{4,6})',
+    r'Grid Reference[:\s]*([A-Z]{2}\s?\d{4,6}\s?\d{4,6})'
+))
+
+PERIOD_PATTERNS = tuple(re.compile(pattern, re.I) for pattern in (
+    r'Mid C(\d+)',
+    r'Early C(\d+)',
+    r'Late C(\d+)',
+    r'(\d+)th century',
+    r'(\d+)th-century'
+))
+
+# Terms that mark a paragraph as the architectural description
+ARCHITECTURAL_KEYWORDS = (
+    'semi-detached', 'cottages', 'coursed rubble', 'stone', 'tiled',
+    'brick stacks', 'mullioned', 'casements', 'chamfered', 'beams',
+    'planked doors', 'recessed', 'diagonally-set', 'axial position',
+    'timber', 'slate', 'thatch', 'gable', 'dormer', 'bay window'
+)
+
+# A lookahead alternation matches at every position, so overlapping keywords are all found in one pass
+ARCHITECTURAL_KEYWORD_RE = re.compile('(?=(' + '|'.join(re.escape(keyword) for keyword in ARCHITECTURAL_KEYWORDS) + '))')
+
+# Elements that may act as tabs on a listing page, in order of preference
+TAB_TAGS = ['button', 'div', 'a', 'span']
+
+# Returns [tag, own text, visible and enabled, aria-controls] for each element, in a single WebDriver call
+TAB_DETAILS_SCRIPT = """
+return arguments[0].map(function (el) {
+    var ownText = Array.prototype.filter.call(el.childNodes, function (node) {
+        return node.nodeType === Node.TEXT_NODE;
+    }).map(function (node) { return node.textContent; }).join('');
+    var style = window.getComputedStyle(el);
+    var visible = el.getClientRects().length > 0 && style.visibility !== 'hidden';
+    return [el.tagName.toLowerCase(), ownText, visible && !el.disabled, el.getAttribute('aria-controls')];
+});
+"""
+
+# Mount points of client-side apps; if one is present but empty, the page still needs JavaScript
+APP_SHELL_IDS = ['app', 'root', '__next']
+
+# Session for the browserless fetch path, created on first use
+_static_session = None
+_static_session_lock = threading.Lock()
+
+# Labelled IDs of any length, 8-12 digit references, and standalone 12-digit numbers, in one scan.
+# Markup between a label and its number (e.g. <dt>UPRN</dt><dd>...) is skipped in the regex itself,
+# so the raw-bytes scan keeps the label context without building a DOM
+_UPRN_GAP = r'(?:[:\s]|<[^<>]{0,200}>)*'
+UPRN_RE = re.compile(
+    r'(?:UPRN|Property ID|Address ID|Building ID)' + _UPRN_GAP + r'(\d+)'
+    r'|Reference' + _UPRN_GAP + r'(\d{8,12})'
+    r'|(?<!\d)(\d{12})(?!\d)',
+    re.I
+)
+
+# The same scan over undecoded response bodies; the labels and digits are all ASCII
+UPRN_BYTES_RE = re.compile(UPRN_RE.pattern.encode('ascii'), re.I)
+
+# Third-party analytics and tracking requests that Chrome is told not to make
+BLOCKED_URL_PATTERNS = [
+    '*google-analytics.com*',
+    '*googletagmanager.com*',
+    '*doubleclick.net*',
+    '*hotjar.com*',
+    '*facebook.net*',
+    '*clarity.ms*'
+]
+
+
+def _first_group(patterns: Tuple[re.Pattern, ...], text: str) -> str:
+    """Return the first capture of the first pattern that matches, or an empty string"""
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            return match.group(1)
+    return ''
+
+
+def _get_static_session() -> requests.Session:
+    """Return the pooled session shared by every scraper (and scrape_many thread) in the process"""
+    global _static_session
+    with _static_session_lock:
+        if _static_session is None:
+            _static_session = create_session()
+        return _static_session
+
+
+def _dump_json_line(record: Dict[str, Any]) -> str:
+    """Encode one record as a line of JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS).decode('utf-8') + '\n'
+    return json.dumps(record, ensure_ascii=False) + '\n'
+
+
+def _is_server_rendered(soup: BeautifulSoup) -> bool:
+    """Whether fetched HTML already holds the page content, rather than a shell for JavaScript to fill"""
+    if soup.find('h1') is None:
+        return False
+    shell = soup.find(id=APP_SHELL_IDS)
+    return shell is None or bool(shell.get_text(strip=True))
 
 
 class HistoricEnglandScraper:
     """Scraper for Historic England building pages"""
     
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, use_static: bool = True, reuse_driver: bool = False,
+                 capture_json: bool = False):
         self.headless = headless
+        self.use_static = use_static
+        self.reuse_driver = reuse_driver
+        self.capture_json = capture_json
+        self.driver = None
+    
+    def __enter__(self) -> 'HistoricEnglandScraper':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Quit the Chrome WebDriver if one is running"""
+        if self.driver:
+            try:
+                self.driver.quit()
+            finally:
+                self.driver = None
+    
+    def _discard_driver(self):
+        """Drop a driver whose session may be dead, still trying to quit it so Chrome is not left running"""
+        try:
+            self.driver.quit()
+        except Exception:
+            # quit() on a dead session raises too; there is nothing more to clean up
+            pass
         self.driver = None
     
+    def _release_driver(self):
+        """Quit the driver after a scrape unless it is being kept warm for the next one"""
+        if not self.reuse_driver:
+            self.close()
+    
     def _setup_driver(self):
         """Set up Chrome WebDriver"""
+        # A kept driver only needs its cookies cleared to start the next page from a clean state
+        if self.driver is not None:
+            try:
+                self.driver.delete_all_cookies()
+                return True
+            except Exception:
+                self._discard_driver()
+        
+        if webdriver is None:
+            print("❌ Error setting up driver: selenium is not installed (pip install selenium)")
+            return False
+        
         try:
-            from selenium import webdriver
-            from selenium.webdriver.chrome.options import Options
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.support import expected_conditions as EC
-            from selenium.webdriver.support.ui import WebDriverWait
-            
             options = Options()
             if self.headless:
                 options.add_argument('--headless')
@@ -37,7 +230,23 @@ class HistoricEnglandScraper:
             options.add_experimental_option('useAutomationExtension', False)
             options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
             
-            self.driver = webdriver.Chrome(options=options)
+            # Only text is extracted, so skip downloading images, fonts and media, and return from
+            # get() at DOMContentLoaded. Stylesheets stay on: tab visibility checks depend on them.
+            options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.managed_default_content_settings.fonts': 2,
+                'profile.managed_default_content_settings.media_stream': 2,
+                'profile.default_content_setting_values.notifications': 2
+            })
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.page_load_strategy = 'eager'
+            
+            # Chrome's performance log carries the Network events needed to read XHR bodies back
+            if self.capture_json:
+                options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+            
+            self.driver = webdriver.Chrome(options=options, keep_alive=True)
+            self._block_tracking_requests()
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
             return True
@@ -45,20 +254,116 @@ class HistoricEnglandScraper:
             print(f"❌ Error setting up driver: {e}")
             return False
     
+    def _block_tracking_requests(self):
+        """Stop Chrome fetching analytics and ad scripts, which only delay page load"""
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        except Exception:
+            # Not fatal: the page still loads, just with its trackers
+            pass
+    
+    def _load_page(self, url: str):
+        """Navigate to url, restarting Chrome once if a kept driver's session has died"""
+        try:
+            self.driver.get(url)
+        except WebDriverException:
+            if not self.reuse_driver:
+                raise
+            self._discard_driver()
+            if not self._setup_driver():
+                raise
+            self.driver.get(url)
+    
+    def _find_tabs(self, tab_texts: List[str]) -> List[Tuple[Any, str, Optional[str]]]:
+        """Locate a visible, enabled element for each tab text, returning (element, text, panel id) tuples"""
+        # One XPath and one script call replace a find_elements plus per-element checks for every tag/text pair
+        tags = ' or '.join(f"self::{tag}" for tag in TAB_TAGS)
+        matches = ' or '.join(f"contains(text(), '{text}')" for text in tab_texts)
+        try:
+            elements = self.driver.find_elements(By.XPATH, f"//*[{tags}][{matches}]")
+            details = self.driver.execute_script(TAB_DETAILS_SCRIPT, elements) if elements else []
+        except Exception:
+            return []
+        
+        found_tabs = []
+        for text in tab_texts:
+            # Prefer buttons, then divs, links and spans, and the first in the document within each
+            candidates = [
+                (TAB_TAGS.index(tag), index)
+                for index, (tag, own_text, usable, _) in enumerate(details)
+                if usable and text in own_text and tag in TAB_TAGS
+            ]
+            if candidates:
+                index = min(candidates)[1]
+                found_tabs.append((elements[index], text, details[index][3]))
+        
+        return found_tabs
+    
+    def _collect_json_responses(self) -> Dict[str, Any]:
+        """Return the JSON bodies the page has fetched, keyed by URL, from Chrome's performance log"""
+        responses = {}
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception:
+            return responses
+        
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+                if message.get('method') != 'Network.responseReceived':
+                    continue
+                
+                response = message['params']['response']
+                if 'json' not in response.get('mimeType', ''):
+                    continue
+                
+                body = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': message['params']['requestId']})
+                data = base64.b64decode(body['body']) if body.get('base64Encoded') else body['body']
+                responses[response['url']] = json.loads(data)
+            except Exception:
+                # Bodies of redirects and evicted requests are no longer available; skip them
+                continue
+        
+        return responses
+    
+    def _wait_for_content(self):
+        """Wait until the listing content has rendered, for no longer than the old fixed 2 s pause"""
+        try:
+            WebDriverWait(self.driver, 2).until(EC.any_of(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'main h1')),
+                EC.presence_of_element_located((By.CSS_SELECTOR, '[class*=list-entry]'))
+            ))
+        except:
+            pass
+    
     def _handle_cookie_consent(self):
         """Handle cookie consent banner"""
         try:
-            from selenium.webdriver.common.by import By
-            
             cookie_buttons = self.driver.find_elements(By.XPATH, "//button[contains(text(), 'Accept') or contains(text(), 'Accept All')]")
             if cookie_buttons:
                 cookie_buttons[0].click()
-                time.sleep(1)
+                # Continue as soon as the banner goes, waiting no longer than the old fixed pause
+                try:
+                    WebDriverWait(self.driver, 1).until(EC.invisibility_of_element(cookie_buttons[0]))
+                except:
+                    pass
                 return True
         except:
             pass
         return False
     
+    def _fetch_static(self, url: str) -> Optional[BeautifulSoup]:
+        """Fetch a page over plain HTTP, returning None if it is not server-rendered"""
+        try:
+            response = _get_static_session().get(url, timeout=DEFAULT_TIMEOUT)
+            response.raise_for_status()
+        except requests.exceptions.RequestException:
+            return None
+        
+        soup = BeautifulSoup(response.text, HTML_PARSER)
+        return soup if _is_server_rendered(soup) else None
+    
     def scrape_building(self, url: str, building_name: str = "") -> Tuple[Optional[Dict[str, Any]], Dict[str, float]]:
         """Scrape a single building page"""
         timing = {
@@ -70,6 +375,21 @@ class HistoricEnglandScraper:
             'total_time': 0
         }
         
+        # Server-rendered pages need no browser; only fall back to Chrome when the HTML is incomplete
+        if self.use_static:
+            page_start = time.time()
+            soup = self._fetch_static(url)
+            timing['page_load_time'] = time.time() - page_start
+            if soup is not None:
+                scrape_start = time.time()
+                content = self._extract_content(soup, building_name)
+                content['url'] = url
+                content['scraped_at'] = datetime.now().isoformat()
+                
+                timing['scraping_time'] = time.time() - scrape_start
+                timing['total_time'] = time.time() - timing['start_time']
+                return content, timing
+        
         try:
             # Setup driver
             setup_start = time.time()
@@ -80,11 +400,7 @@ class HistoricEnglandScraper:
             
             # Load page
             page_start = time.time()
-            self.driver.get(url)
-            
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.support import expected_conditions as EC
-            from selenium.webdriver.support.ui import WebDriverWait
+            self._load_page(url)
             
             wait = WebDriverWait(self.driver, 15)
             try:
@@ -99,12 +415,12 @@ class HistoricEnglandScraper:
             self._handle_cookie_consent()
             timing['cookie_time'] = time.time() - cookie_start
             
-            time.sleep(2)
+            self._wait_for_content()
             
             # Scrape content
             scrape_start = time.time()
             html = self.driver.page_source
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, HTML_PARSER)
             
             content = self._extract_content(soup, building_name)
             content['url'] = url
@@ -120,8 +436,102 @@ class HistoricEnglandScraper:
             timing['total_time'] = time.time() - timing['start_time']
             return None, timing
         finally:
-            if self.driver:
-                self.driver.quit()
+            self._release_driver()
+    
+    def scrape_uprns(self, url: str, building_name: str = "") -> Tuple[Optional[Dict[str, Any]], Dict[str, float]]:
+        """Find UPRNs on a page by scanning its raw bytes, skipping HTML parsing entirely"""
+        timing = {
+            'start_time': time.time(),
+            'page_load_time': 0,
+            'scraping_time': 0,
+            'total_time': 0
+        }
+        
+        page_start = time.time()
+        try:
+            response = _get_static_session().get(url, timeout=DEFAULT_TIMEOUT)
+            response.raise_for_status()
+            body = response.content
+        except requests.exceptions.RequestException as e:
+            print(f"❌ Scraping error: {e}")
+            timing['total_time'] = time.time() - timing['start_time']
+            return None, timing
+        timing['page_load_time'] = time.time() - page_start
+        
+        scrape_start = time.time()
+        uprns = self.search_for_uprn_patterns(body)
+        content = {
+            'url': url,
+            'building_name': building_name,
+            'scraped_at': datetime.now().isoformat(),
+            'uprn_found': uprns,
+            'uprn_count': len(uprns)
+        }
+        
+        timing['scraping_time'] = time.time() - scrape_start
+        timing['total_time'] = time.time() - timing['start_time']
+        return content, timing
+    
+    def scrape_many(self, urls: List[str], concurrency: int = 4, use_processes: bool = False,
+                    max_rate: Optional[float] = None) -> List[Tuple[Optional[Dict[str, Any]], Dict[str, float]]]:
+        """
+        Scrape several building pages in parallel, returning (content, timing) pairs in URL order.
+        
+        With use_processes, each worker is a separate process with its own driver, which also
+        spreads the BeautifulSoup parsing across CPU cores. max_rate caps page requests per second;
+        workers only wait when they would exceed it, instead of pausing after every page.
+        """
+        return list(self.iter_scrape(urls, concurrency, use_processes, max_rate))
+    
+    def scrape_to_jsonl(self, urls: List[str], output_file: str, concurrency: int = 4, use_processes: bool = False,
+                        max_rate: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Scrape pages in parallel, appending one JSON line per page to output_file as each finishes.
+        
+        Only one result is held at a time, and a partial run leaves every completed page on disk.
+        Returns a small summary of the run.
+        """
+        summary = {'pages': 0, 'succeeded': 0, 'total_time': 0.0}
+        with open(output_file, 'a', encoding='utf-8') as f:
+            for url, (content, timing) in zip(urls, self.iter_scrape(urls, concurrency, use_processes, max_rate)):
+                f.write(_dump_json_line({'url': url, 'content': content, 'timing': timing}))
+                summary['pages'] += 1
+                summary['succeeded'] += content is not None
+                summary['total_time'] += timing.get('total_time', 0)
+        return summary
+    
+    def iter_scrape(self, urls: List[str], concurrency: int = 4, use_processes: bool = False,
+                    max_rate: Optional[float] = None) -> Iterator[Tuple[Optional[Dict[str, Any]], Dict[str, float]]]:
+        """Scrape pages in parallel like scrape_many, yielding each (content, timing) pair in URL order"""
+        if use_processes:
+            # Processes cannot share one limiter, so each worker takes an equal share of the rate
+            worker_rate = max_rate / concurrency if max_rate else None
+            init_args = (self.headless, self.use_static, self.capture_json, worker_rate)
+            with ProcessPoolExecutor(max_workers=concurrency, initializer=_init_worker, initargs=init_args) as executor:
+                yield from executor.map(_scrape_in_worker, urls)
+            return
+        
+        # Each worker thread keeps its own warm driver; WebDriver sessions are not safe to share between threads
+        local = threading.local()
+        workers = []
+        limiter = RateLimiter(max_rate) if max_rate else None
+        
+        def scrape(url):
+            scraper = getattr(local, 'scraper', None)
+            if scraper is None:
+                scraper = local.scraper = type(self)(self.headless, self.use_static, reuse_driver=True,
+                                                     capture_json=self.capture_json)
+                workers.append(scraper)
+            if limiter:
+                limiter.acquire()
+            return scraper.scrape_building(url)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                yield from executor.map(scrape, urls)
+        finally:
+            for scraper in workers:
+                scraper.close()
     
     def scrape_with_tabs(self, url: str, building_name: str = "") -> Tuple[Optional[Dict[str, Any]], Dict[str, float]]:
         """Scrape building page with tab navigation"""
@@ -146,11 +556,7 @@ class HistoricEnglandScraper:
             
             # Load page
             page_start = time.time()
-            self.driver.get(url)
-            
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.support import expected_conditions as EC
-            from selenium.webdriver.support.ui import WebDriverWait
+            self._load_page(url)
             
             wait = WebDriverWait(self.driver, 15)
             try:
@@ -165,7 +571,7 @@ class HistoricEnglandScraper:
             self._handle_cookie_consent()
             timing['cookie_time'] = time.time() - cookie_start
             
-            time.sleep(2)
+            self._wait_for_content()
             
             # Get initial content (Overview tab)
             all_content = {
@@ -177,77 +583,84 @@ class HistoricEnglandScraper:
             }
             
             initial_html = self.driver.page_source
-            initial_soup = BeautifulSoup(initial_html, 'html.parser')
+            initial_soup = BeautifulSoup(initial_html, HTML_PARSER)
             all_content['overview'] = self._extract_tab_content(initial_soup, 'Overview')
             
             # Look for and click other tabs
             tab_start = time.time()
-            tab_texts = ['Official List Entry', 'Comments', 'Photos']
-            found_tabs = []
-            
-            for text in tab_texts:
-                try:
-                    xpath_patterns = [
-                        f"//button[contains(text(), '{text}')]",
-                        f"//div[contains(text(), '{text}')]",
-                        f"//a[contains(text(), '{text}')]",
-                        f"//span[contains(text(), '{text}')]"
-                    ]
-                    
-                    for xpath in xpath_patterns:
-                        elements = self.driver.find_elements(By.XPATH, xpath)
-                        for elem in elements:
-                            if elem.is_displayed() and elem.is_enabled():
-                                found_tabs.append({
-                                    'element': elem,
-                                    'text': text,
-                                    'tag': elem.tag_name
-                                })
-                                break
-                        if found_tabs and any(tab['text'] == text for tab in found_tabs):
-                            break
-                except:
-                    continue
+            found_tabs = self._find_tabs(['Official List Entry', 'Comments', 'Photos'])
+            page_changed = False
             
             # Click on each tab and collect content
-            for tab in found_tabs:
+            for element, text, panel_id in found_tabs:
                 try:
                     tab_click_start = time.time()
                     
-                    self.driver.execute_script("arguments[0].scrollIntoView(true);", tab['element'])
-                    time.sleep(1)
+                    # Panels already rendered into the DOM (hidden with CSS) can be read from the first parse
+                    panel = initial_soup.find(id=panel_id) if panel_id else None
+                    if panel is None or not panel.get_text(strip=True):
+                        # scrollIntoView is synchronous, so the tab is clickable straight away
+                        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+                        
+                        page_changed = True
+                        try:
+                            element.click()
+                        except:
+                            self.driver.execute_script("arguments[0].click();", element)
+                        
+                        # Wait for the tab's own panel when it names one, rather than a fixed pause
+                        if panel_id:
+                            try:
+                                wait.until(EC.visibility_of_element_located((By.ID, panel_id)))
+                            except:
+                                pass
+                        else:
+                            # Otherwise wait for the tab itself to report being selected, capped at the old 3 s pause
+                            try:
+                                WebDriverWait(self.driver, 3).until(
+                                    lambda driver: element.get_attribute('aria-selected') == 'true'
+                                    or 'active' in (element.get_attribute('class') or '').split()
+                                )
+                            except:
+                                pass
+                        
+                        # Ship and parse just the tab's panel rather than serialising the whole document again
+                        if panel_id:
+                            try:
+                                html = self.driver.find_element(By.ID, panel_id).get_attribute('outerHTML')
+                            except:
+                                html = self.driver.page_source
+                        else:
+                            html = self.driver.page_source
+                        panel = BeautifulSoup(html, HTML_PARSER)
                     
-                    try:
-                        tab['element'].click()
-                    except:
-                        self.driver.execute_script("arguments[0].click();", tab['element'])
-                    
-                    time.sleep(3)
-                    
-                    html = self.driver.page_source
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    tab_content = self._extract_tab_content(soup, tab['text'])
-                    all_content['tabs_clicked'].append(tab['text'])
+                    tab_content = self._extract_tab_content(panel, text)
+                    all_content['tabs_clicked'].append(text)
                     
                     # Store content by tab type
-                    if 'official' in tab['text'].lower() or 'list entry' in tab['text'].lower():
+                    lower_text = text.lower()
+                    if 'official' in lower_text or 'list entry' in lower_text:
                         all_content['official_list_entry'] = tab_content
-                    elif 'comment' in tab['text'].lower() or 'photo' in tab['text'].lower():
+                    elif 'comment' in lower_text or 'photo' in lower_text:
                         all_content['comments_photos'] = tab_content
                     
                     tab_click_end = time.time()
-                    timing['tab_timings'][tab['text'].lower().replace(' ', '_')] = tab_click_end - tab_click_start
+                    timing['tab_timings'][lower_text.replace(' ', '_')] = tab_click_end - tab_click_start
                     
                 except Exception as e:
-                    print(f"      ❌ Error clicking tab '{tab['text']}': {e}")
+                    print(f"      ❌ Error clicking tab '{text}': {e}")
                     continue
             
             timing['tab_navigation_time'] = time.time() - tab_start
             
+            # Structured data the page loaded over XHR, straight from the network rather than the rendered HTML
+            if self.capture_json:
+                all_content['json_responses'] = self._collect_json_responses()
+            
             # Final content extraction
             extract_start = time.time()
-            final_html = self.driver.page_source
+            # Only serialise the document again if a click may have changed it
+            final_html = self.driver.page_source if page_changed else initial_html
             timing['content_extraction_time'] = time.time() - extract_start
             timing['total_time'] = time.time() - timing['start_time']
             
@@ -266,8 +679,7 @@ class HistoricEnglandScraper:
             timing['total_time'] = time.time() - timing['start_time']
             return None, timing
         finally:
-            if self.driver:
-                self.driver.quit()
+            self._release_driver()
     
     def _extract_content(self, soup: BeautifulSoup, building_name: str = "") -> Dict[str, Any]:
         """Extract content from a page"""
@@ -281,63 +693,14 @@ class HistoricEnglandScraper:
             'specific_data': {}
         }
         
-        # Extract headings
-        headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-        for heading in headings:
-            text = heading.get_text().strip()
-            if text and 'cookie' not in text.lower():
-                content['headings'].append({
-                    'level': heading.name,
-                    'text': text
-                })
-        
-        # Extract paragraphs
-        paragraphs = soup.find_all('p')
-        for p in paragraphs:
-            text = p.get_text().strip()
-            if text and len(text) > 20 and 'cookie' not in text.lower():
-                content['paragraphs'].append({
-                    'text': text,
-                    'length': len(text)
-                })
-        
-        # Extract images
-        images = soup.find_all('img')
-        for img in images:
-            src = img.get('src', '')
-            alt = img.get('alt', '')
-            if src:
-                if src.startswith('/'):
-                    src = 'https://historicengland.org.uk' + src
-                content['images'].append({
-                    'src': src,
-                    'alt': alt
-                })
-        
-        # Extract links
-        links = soup.find_all('a', href=True)
-        for link in links:
-            href = link.get('href', '')
-            text = link.get_text().strip()
-            if href and text:
-                if href.startswith('/'):
-                    href = 'https://historicengland.org.uk' + href
-                content['links'].append({
-                    'href': href,
-                    'text': text
-                })
-        
-        # Get main text content
-        main_content = soup.find('main') or soup.find('body')
-        if main_content:
-            content['text_content'] = main_content.get_text().strip()
+        self._extract_elements(soup, content)
         
         # Extract specific building data
         content['specific_data'] = self._extract_building_specific_data(soup)
         
         return content
     
-    def _extract_tab_content(self, soup: BeautifulSoup, tab_name: str) -> Dict[str, Any]:
+    def _extract_tab_content(self, soup: Union[BeautifulSoup, Tag], tab_name: str) -> Dict[str, Any]:
         """Extract content from a specific tab"""
         content = {
             'tab_name': tab_name,
@@ -349,62 +712,70 @@ class HistoricEnglandScraper:
             'specific_data': {}
         }
         
-        # Extract headings
-        headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-        for heading in headings:
-            text = heading.get_text().strip()
-            if text and 'cookie' not in text.lower():
-                content['headings'].append({
-                    'level': heading.name,
-                    'text': text
-                })
+        self._extract_elements(soup, content)
         
-        # Extract paragraphs
-        paragraphs = soup.find_all('p')
-        for p in paragraphs:
-            text = p.get_text().strip()
-            if text and len(text) > 20 and 'cookie' not in text.lower():
-                content['paragraphs'].append({
-                    'text': text,
-                    'length': len(text)
-                })
+        # Extract specific data for official list entry
+        lower_name = tab_name.lower()
+        if 'official' in lower_name or 'list entry' in lower_name:
+            content['specific_data'] = self._extract_building_specific_data(soup)
         
-        # Extract images
-        images = soup.find_all('img')
-        for img in images:
-            src = img.get('src', '')
-            alt = img.get('alt', '')
-            if src:
-                if src.startswith('/'):
-                    src = 'https://historicengland.org.uk' + src
-                content['images'].append({
-                    'src': src,
-                    'alt': alt
-                })
+        return content
+    
+    def _extract_elements(self, soup: Union[BeautifulSoup, Tag], content: Dict[str, Any]):
+        """Fill in headings, paragraphs, images, links and text content from a single walk over the page"""
+        # Navigation and footer repeat the same links and icons; keep the first of each and share their strings
+        seen_images = set()
+        seen_links = set()
         
-        # Extract links
-        links = soup.find_all('a', href=True)
-        for link in links:
-            href = link.get('href', '')
-            text = link.get_text().strip()
-            if href and text:
-                if href.startswith('/'):
-                    href = 'https://historicengland.org.uk' + href
-                content['links'].append({
-                    'href': href,
-                    'text': text
-                })
+        for element in soup.find_all(CONTENT_TAGS):
+            name = element.name
+            
+            if name == 'p':
+                text = element.get_text().strip()
+                if text and len(text) > 20 and not COOKIE_RE.search(text):
+                    content['paragraphs'].append({
+                        'text': text,
+                        'length': len(text)
+                    })
+                    
+            elif name == 'img':
+                src = element.get('src', '')
+                alt = element.get('alt', '')
+                if src:
+                    if src.startswith('/'):
+                        src = urljoin(SITE_URL, src)
+                    if (src, alt) not in seen_images:
+                        seen_images.add((src, alt))
+                        content['images'].append({
+                            'src': sys.intern(src),
+                            'alt': sys.intern(alt)
+                        })
+                        
+            elif name == 'a':
+                href = element.get('href', '')
+                text = element.get_text().strip()
+                if href and text:
+                    if href.startswith('/'):
+                        href = urljoin(SITE_URL, href)
+                    if (href, text) not in seen_links:
+                        seen_links.add((href, text))
+                        content['links'].append({
+                            'href': sys.intern(href),
+                            'text': sys.intern(text)
+                        })
+                        
+            else:
+                text = element.get_text().strip()
+                if text and not COOKIE_RE.search(text):
+                    content['headings'].append({
+                        'level': name,
+                        'text': text
+                    })
         
-        # Get main text content
-        main_content = soup.find('main') or soup.find('body')
+        # Get main text content (a tab panel has neither, so fall back to the panel itself)
+        main_content = soup.find('main') or soup.find('body') or soup
         if main_content:
             content['text_content'] = main_content.get_text().strip()
-        
-        # Extract specific data for official list entry
-        if 'official' in tab_name.lower() or 'list entry' in tab_name.lower():
-            content['specific_data'] = self._extract_building_specific_data(soup)
-        
-        return content
     
     def _extract_building_specific_data(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract specific building data from the official list entry tab"""
@@ -426,114 +797,68 @@ class HistoricEnglandScraper:
             'exterior_features': ''
         }
         
-        # Look for grade
-        grade_patterns = [
-            r'Grade\s+([I2*]+)',
-            r'Grade\s*:\s*([I2*]+)',
-            r'([I2*]+)\s*Grade'
-        ]
-        
-        for pattern in grade_patterns:
-            grade_match = soup.find(string=re.compile(pattern, re.I))
-            if grade_match:
-                match = re.search(pattern, grade_match, re.I)
-                if match:
-                    data['grade'] = match.group(1)
-                    break
-        
-        # Look for list entry
-        entry_patterns = [
-            r'List Entry\s*[:\s]*(\d+)',
-            r'Entry\s*[:\s]*(\d+)',
-            r'(\d{6,})'
-        ]
-        
-        for pattern in entry_patterns:
-            entry_match = soup.find(string=re.compile(pattern, re.I))
-            if entry_match:
-                match = re.search(pattern, entry_match, re.I)
-                if match:
-                    data['list_entry'] = match.group(1)
-                    break
-        
-        # Look for coordinates
-        coord_patterns = [
-            r'National Grid Reference[:\s]*([A-Z]{2}\s?\d{4,6}\s?\d{4,6})',
-            r'NGR[:\s]*([A-Z]{2}\s?\d{4,6}\s?\d{4,6})',
-            r'Grid Reference[:\s]*([A-Z]{2}\s?\d{4,6}\s?\d{4,6})'
-        ]
-        
-        for pattern in coord_patterns:
-            coord_match = soup.find(string=re.compile(pattern, re.I))
-            if coord_match:
-                match = re.search(pattern, coord_match, re.I)
-                if match:
-                    data['coordinates'] = match.group(1)
-                    break
+        # Search the page text once per pattern, rather than walking every text node for each one.
+        # Whitespace-only nodes (indentation between tags) are dropped so there is less text to scan.
+        full_text = soup.get_text(' ', strip=True)
+        data['grade'] = _first_group(GRADE_PATTERNS, full_text)
+        data['list_entry'] = _first_group(ENTRY_PATTERNS, full_text)
+        data['coordinates'] = _first_group(COORD_PATTERNS, full_text)
         
         # Look for architectural description in paragraphs
-        architectural_keywords = [
-            'semi-detached', 'cottages', 'coursed rubble', 'stone', 'tiled',
-            'brick stacks', 'mullioned', 'casements', 'chamfered', 'beams',
-            'planked doors', 'recessed', 'diagonally-set', 'axial position',
-            'timber', 'slate', 'thatch', 'gable', 'dormer', 'bay window'
-        ]
-        
         for para in soup.find_all('p'):
             text = para.get_text().strip()
             if len(text) > 100:
-                keyword_count = sum(1 for keyword in architectural_keywords if keyword.lower() in text.lower())
-                if keyword_count >= 3:
+                # One scan of the lowercased paragraph finds every keyword it contains
+                lower_text = text.lower()
+                keywords_found = set(ARCHITECTURAL_KEYWORD_RE.findall(lower_text))
+                if len(keywords_found) >= 3:
                     data['architectural_details'] = text
                     
                     # Extract specific details
-                    if 'coursed rubble' in text.lower():
+                    if 'coursed rubble' in keywords_found:
                         data['materials'] += 'coursed rubble stone, '
-                    if 'tiled' in text.lower():
+                    if 'tiled' in keywords_found:
                         data['materials'] += 'tiled roof, '
-                    if 'brick' in text.lower():
+                    if 'brick' in lower_text:
                         data['materials'] += 'brick, '
-                    if 'timber' in text.lower():
+                    if 'timber' in keywords_found:
                         data['materials'] += 'timber, '
                     
                     # Extract construction period
-                    period_patterns = [
-                        r'Mid C(\d+)',
-                        r'Early C(\d+)',
-                        r'Late C(\d+)',
-                        r'(\d+)th century',
-                        r'(\d+)th-century'
-                    ]
-                    
-                    for pattern in period_patterns:
-                        match = re.search(pattern, text, re.I)
-                        if match:
-                            data['construction_period'] = match.group(1)
-                            break
+                    data['construction_period'] = _first_group(PERIOD_PATTERNS, text)
                     
                     break
         
         return data
     
-    def search_for_uprn_patterns(self, text: str) -> List[str]:
-        """Search for UPRN patterns in text"""
-        patterns = [
-            r'UPRN[:\s]*(\d{12})',  # UPRN: 123456789012
-            r'Unique Property Reference Number[:\s]*(\d{12})',
-            r'Property Reference[:\s]*(\d{12})',
-            r'(\d{12})',  # Any 12-digit number
-            r'UPRN[:\s]*(\d+)',  # UPRN with any number of digits
-            r'Property ID[:\s]*(\d+)',
-            r'Address ID[:\s]*(\d+)',
-            r'Building ID[:\s]*(\d+)',
-            r'Reference[:\s]*(\d{8,12})',  # 8-12 digit reference
-        ]
-        
-        found = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if len(match) >= 8:  # UPRN should be at least 8 digits
-                    found.append(match)
+    def search_for_uprn_patterns(self, text: Union[str, bytes]) -> List[str]:
+        """Search for UPRN patterns in text, or in raw page bytes without decoding them first"""
+        pattern = UPRN_BYTES_RE if isinstance(text, bytes) else UPRN_RE
+        found = set()  # Duplicates collapse as they are found
+        for match in pattern.finditer(text):
+            value = match.group(match.lastindex)
+            if len(value) >= 8:  # UPRN should be at least 8 digits
+                found.add(value.decode('ascii') if isinstance(value, bytes) else value)
         
-        return list(set(found))  # Remove duplicates
+        return sorted(found)
+
+
+# Per-process scraper used by scrape_many(use_processes=True)
+_worker_scraper = None
+_worker_limiter = None
+
+
+def _init_worker(headless: bool, use_static: bool, capture_json: bool, max_rate: Optional[float]):
+    """Give a pool process its own scraper, quitting its driver when the process shuts down"""
+    global _worker_scraper, _worker_limiter
+    _worker_scraper = HistoricEnglandScraper(headless, use_static, reuse_driver=True, capture_json=capture_json)
+    _worker_limiter = RateLimiter(max_rate) if max_rate else None
+    # Pool processes skip atexit handlers, but multiprocessing runs its finalizers on exit
+    Finalize(_worker_scraper, _worker_scraper.close, exitpriority=10)
+
+
+def _scrape_in_worker(url: str) -> Tuple[Optional[Dict[str, Any]], Dict[str, float]]:
+    """Scrape one page with this process's scraper"""
+    if _worker_limiter:
+        _worker_limiter.acquire()
+    return _worker_scraper.scrape_building(url)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for complete_scraper's static (browserless) list entry parsing
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from complete_scraper import parse_web_data
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+class ParseWebDataTests(unittest.TestCase):
+    """parse_web_data on a saved official list entry page"""
+
+    @classmethod
+    def setUpClass(cls):
+        with open(os.path.join(FIXTURE_DIR, "list_entry_1380908.html"), encoding="utf-8") as f:
+            cls.web_data = parse_web_data(f.read())
+
+    def test_title_and_address(self):
+        self.assertEqual(self.web_data['title'], "10 Ship Street")
+        self.assertEqual(self.web_data['address'], "10, Ship Street, BN1 1AD")
+
+    def test_key_info_pairs_terms_with_definitions(self):
+        self.assertEqual(self.web_data['key_info'], {
+            "Heritage Category": "Listed Building",
+            "Grade": "II",
+            "List Entry Number": "1380908",
+            "Date first listed": "26-Aug-1999",
+            "List Entry Name": "10 Ship Street",
+            "Statutory Address 1": "10, Ship Street, BN1 1AD"
+        })
+        self.assertIsNone(self.web_data['major_amendment_date'])
+
+    def test_location(self):
+        self.assertEqual(self.web_data['location'], {
+            "statutory_address": "10, Ship Street, BN1 1AD",
+            "district": "The City of Brighton and Hove (Unitary Authority)",
+            "parish": "Non Civil Parish",
+            "national_grid_reference": "TQ 30951 04040"
+        })
+
+    def test_description_and_minor_amendment(self):
+        self.assertTrue(self.web_data['description'].startswith("This list entry was subject to a Minor Amendment"))
+        self.assertTrue(self.web_data['description'].endswith("Listing NGR: TQ3095104040"))
+        self.assertEqual(self.web_data['minor_amendment_date'], "17 April 2024")
+
+    def test_legacy_legal_and_map(self):
+        self.assertEqual(self.web_data['legacy'], {"legacy_system_number": "481232", "legacy_system": "LBS"})
+        self.assertTrue(self.web_data['legal'].startswith("This List entry helps identify the building"))
+        self.assertNotIn('sources', self.web_data)
+        self.assertEqual(
+            self.web_data['map_pdf_url'],
+            "https://mapservices1.historicengland.org.uk/printwebservicehle/StatutoryPrint.svc/343616/"
+            "HLE_A4L_Grade%7CHLE_A3L_Grade.pdf"
+        )
+
+    def test_page_without_sections_gives_empty_sections(self):
+        web_data = parse_web_data("<html><body><main><h1>Untitled</h1></main></body></html>")
+        self.assertEqual(web_data['title'], "Untitled")
+        self.assertEqual(web_data['key_info'], {})
+        self.assertEqual(web_data['location'], {})
+        self.assertEqual(web_data['legacy'], {})
+        self.assertNotIn('description', web_data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for database_scraper's batch fetching, run against mocked API replies
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database_scraper import BUILDING_COLUMNS, DatabaseScraper
+
+
+def _reply(payload):
+    """Stand-in for a requests.Response carrying a JSON payload"""
+    response = mock.Mock()
+    response.headers = {}
+    response.content = json.dumps(payload).encode()
+    response.text = response.content.decode()
+    response.json.return_value = payload
+    return response
+
+
+class FetchBatchTests(unittest.TestCase):
+    """fetch_batch against replies shaped like the NHLE layer's"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.scraper = DatabaseScraper(os.path.join(self.tmpdir.name, "test.db"), batch_size=10)
+
+    def tearDown(self):
+        self.scraper.db.engine.dispose()
+        self.tmpdir.cleanup()
+
+    def _fetch(self, payload):
+        with mock.patch.object(self.scraper.api_client.session, "get", return_value=_reply(payload)) as get:
+            rows, count = self.scraper.fetch_batch(0, 10)
+        return rows, count, get.call_args.kwargs["params"]
+
+    def test_reply_without_category(self):
+        payload = {"features": [{
+            "attributes": {
+                "Name": "CHURCH OF ST MARY", "Grade": "I", "ListEntry": 1000001,
+                "ListDate": 946728000000, "AmendDate": None, "NGR": "TQ 1234 5678",
+                "Easting": 512340, "Northing": 156780, "CaptureScale": "1:2500",
+                "hyperlink": "https://historicengland.org.uk/listing/the-list/list-entry/1000001"
+            },
+            "geometry": {"x": 512340.0, "y": 156780.0}
+        }]}
+
+        rows, count, params = self._fetch(payload)
+
+        self.assertNotIn("Category", params["outFields"].split(","))
+        self.assertEqual(count, 1)
+        row = dict(zip(BUILDING_COLUMNS, rows[0]))
+        self.assertIsNone(row["category"])
+        self.assertEqual(row["list_entry"], 1000001)
+        self.assertEqual(row["list_date"], "01-Jan-2000")
+        self.assertIsNone(row["amend_date"])
+        self.assertEqual((row["longitude"], row["latitude"]), (512340.0, 156780.0))
+
+    def test_omitted_attributes_do_not_drop_the_batch(self):
+        payload = {"features": [
+            {"attributes": {"Name": "BARN", "ListEntry": 1000002}},
+            {"attributes": {"Name": "MILL", "Grade": "II", "ListEntry": 1000003, "AmendDate": None}}
+        ]}
+
+        rows, count, _ = self._fetch(payload)
+
+        self.assertEqual(count, 2)
+        first = dict(zip(BUILDING_COLUMNS, rows[0]))
+        self.assertEqual(first["list_entry"], 1000002)
+        self.assertIsNone(first["grade"])
+        self.assertIsNone(first["list_date"])
+        self.assertIsNone(first["longitude"])
+        self.assertEqual(dict(zip(BUILDING_COLUMNS, rows[1]))["grade"], "II")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared token bucket rate limiter, on a fake clock
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shared import rate_limiter
+from shared.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """Stands in for time.monotonic and time.sleep; sleeping just moves the clock on"""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class RateLimiterTests(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.multiple(rate_limiter.time, monotonic=self.clock.monotonic, sleep=self.clock.sleep)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_burst_passes_without_sleeping(self):
+        limiter = RateLimiter(rate=2, burst=3)
+        for _ in range(3):
+            limiter.acquire()
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_calls_past_the_burst_are_paced_at_the_rate(self):
+        limiter = RateLimiter(rate=2, burst=3)
+        for _ in range(6):
+            limiter.acquire()
+        self.assertEqual(self.clock.sleeps, [0.5, 0.5, 0.5])
+
+    def test_idle_time_refills_up_to_the_burst(self):
+        limiter = RateLimiter(rate=2, burst=2)
+        limiter.acquire()
+        limiter.acquire()
+        self.clock.now += 10  # Long idle: the bucket refills, but only to `burst`
+        for _ in range(3):
+            limiter.acquire()
+        self.assertEqual(self.clock.sleeps, [0.5])
+
+    def test_partial_refill_shortens_the_wait(self):
+        limiter = RateLimiter(rate=4)
+        limiter.acquire()
+        self.clock.now += 0.1
+        limiter.acquire()
+        self.assertEqual(len(self.clock.sleeps), 1)
+        self.assertAlmostEqual(self.clock.sleeps[0], 0.15)
+
+    def test_queued_callers_are_spaced_by_reserved_tokens(self):
+        # Waiting happens outside the lock, so callers reserve tokens in order without sleeping in between
+        limiter = RateLimiter(rate=10)
+        waits = []
+        with mock.patch.object(rate_limiter.time, 'sleep', waits.append):  # Record the waits, clock held still
+            for _ in range(4):
+                limiter.acquire()
+        self.assertEqual([round(delay, 6) for delay in waits], [0.1, 0.2, 0.3])
+
+
+if __name__ == "__main__":
+    unittest.main()
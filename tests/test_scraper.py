@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared scraper's UPRN scan
+"""
+
+import os
+import re
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shared.scraper import UPRN_BYTES_RE, UPRN_RE, HistoricEnglandScraper
+
+# The per-call pattern list UPRN_RE replaced, kept here as the reference behaviour
+OLD_UPRN_PATTERNS = [
+    r'UPRN[:\s]*(\d{12})',
+    r'Unique Property Reference Number[:\s]*(\d{12})',
+    r'Property Reference[:\s]*(\d{12})',
+    r'(\d{12})',
+    r'UPRN[:\s]*(\d+)',
+    r'Property ID[:\s]*(\d+)',
+    r'Address ID[:\s]*(\d+)',
+    r'Building ID[:\s]*(\d+)',
+    r'Reference[:\s]*(\d{8,12})',
+]
+
+
+def old_search_for_uprn_patterns(text):
+    """search_for_uprn_patterns as it was before UPRN_RE"""
+    found = []
+    for pattern in OLD_UPRN_PATTERNS:
+        for match in re.findall(pattern, text, re.IGNORECASE):
+            if len(match) >= 8:
+                found.append(match)
+    return sorted(set(found))
+
+
+class UPRNPatternTests(unittest.TestCase):
+    """UPRN_RE and search_for_uprn_patterns against the old pattern list"""
+
+    def setUp(self):
+        self.scraper = HistoricEnglandScraper()
+
+    def assertSameAsOld(self, text):
+        self.assertEqual(self.scraper.search_for_uprn_patterns(text), old_search_for_uprn_patterns(text))
+
+    def test_labels_match_old_patterns(self):
+        for text in (
+            "UPRN: 100062345678",
+            "uprn 22001234",
+            "Property ID: 12345678",
+            "Address ID 987654321",
+            "Building ID:10002000",
+            "Reference: 123456789",
+            "Unique Property Reference Number 100062345678",
+            "Property Reference: 100062345678",
+            "Standalone 100062345678 in prose",
+            "UPRN: 1234567 is too short",
+        ):
+            with self.subTest(text=text):
+                self.assertSameAsOld(text)
+
+    def test_label_across_tags(self):
+        text = "<dl><dt>UPRN</dt>\n<dd class='value'>1000623456</dd></dl>"
+        self.assertEqual(self.scraper.search_for_uprn_patterns(text), ["1000623456"])
+        # The old patterns only allowed ':' and whitespace after a label
+        self.assertEqual(old_search_for_uprn_patterns(text), [])
+
+    def test_reference_across_tags_keeps_length_limit(self):
+        self.assertEqual(self.scraper.search_for_uprn_patterns("<th>Reference</th><td>123456789</td>"), ["123456789"])
+        self.assertEqual(self.scraper.search_for_uprn_patterns("<th>Reference</th><td>1234567</td>"), [])
+
+    def test_twelve_digits_need_digit_boundaries(self):
+        self.assertEqual(self.scraper.search_for_uprn_patterns("id=100062345678&x=1"), ["100062345678"])
+        # Old patterns reported a 12-digit slice of any longer digit run
+        self.assertEqual(self.scraper.search_for_uprn_patterns("timestamp 17000000000001234"), [])
+        self.assertEqual(old_search_for_uprn_patterns("timestamp 17000000000001234"), ["170000000000"])
+
+    def test_bytes_input_matches_str_input(self):
+        text = "<dt>UPRN</dt><dd>1000623456</dd> Reference: 123456789 and 100062345678"
+        self.assertEqual(self.scraper.search_for_uprn_patterns(text.encode('ascii')),
+                         self.scraper.search_for_uprn_patterns(text))
+        self.assertEqual(UPRN_BYTES_RE.pattern, UPRN_RE.pattern.encode('ascii'))
+
+    def test_results_are_deduplicated(self):
+        self.assertEqual(self.scraper.search_for_uprn_patterns("UPRN: 100062345678, again 100062345678"),
+                         ["100062345678"])
+
+
+if __name__ == "__main__":
+    unittest.main()